@@ -0,0 +1,4 @@
+"""Performance benchmarks for terminaltables. Standard library only.
+
+Run from the project's directory with: python -m benchmarks.run --help
+"""
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Compare benchmark results against a baseline and fail on regressions.
+
+Median timings are divided by each run's calibration time before comparing, so a baseline recorded on a faster or
+slower machine is still meaningful. A scenario regresses when it's slower by more than its threshold, which is sized to
+the noise measured in both runs (at least MIN_THRESHOLD percent) unless a fixed --threshold is given.
+
+Usage: python -m benchmarks.compare baseline.json results.json [--threshold 10]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import sys
+
+MIN_THRESHOLD = 5.0  # Percent. Smallest tolerated slowdown, however quiet both runs were.
+NOISE_FACTOR = 4.0  # Tolerated slowdown in multiples of the combined noise of both runs.
+
+
+def median(values):
+    """Return the median of a list of numbers.
+
+    :param iter values: Numbers (at least one).
+
+    :return: Middle value, or mean of the two middle values.
+    :rtype: float
+    """
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2.0
+
+
+def compare(baseline, current):
+    """Compute the machine-speed-normalized change of every scenario present in both reports.
+
+    Noise in the calibration of either run skews every scenario, so it's added to the noise of each. Reports recorded
+    before medians were kept are compared on their best timings, with no noise estimate.
+
+    :param dict baseline: Report from benchmarks.run.run() (or its JSON file).
+    :param dict current: Report to compare against the baseline.
+
+    :return: List of (name, baseline seconds, current seconds, percent change, percent noise) tuples. Positive change
+        is slower. Noise is the sum of both runs' relative median absolute deviations, in percent.
+    :rtype: list
+    """
+    scale = baseline['meta']['calibration'] / current['meta']['calibration']
+    calibration_noise = baseline['meta'].get('calibration_noise', 0.0) + current['meta'].get('calibration_noise', 0.0)
+    baseline_results = dict((r['name'], r) for r in baseline['results'])
+    rows = list()
+    for result in current['results']:
+        if result['name'] not in baseline_results:
+            continue
+        previous = baseline_results[result['name']]
+        key = 'median' if 'median' in previous and 'median' in result else 'best'
+        before, after = previous[key], result[key]
+        noise = previous.get('noise', 0.0) + result.get('noise', 0.0) + calibration_noise
+        rows.append((result['name'], before, after, (after * scale / before - 1) * 100, noise))
+    return rows
+
+
+def print_comparison(rows, threshold=None, stream=None):
+    """Print a comparison table and return the names of regressed scenarios.
+
+    :param list rows: Return value of compare().
+    :param float threshold: Percent slowdown tolerated before a scenario counts as a regression. None sizes it per
+        scenario to NOISE_FACTOR times its noise, at least MIN_THRESHOLD.
+    :param stream: Where to print. Defaults to stdout.
+
+    :return: Names of scenarios slower than their threshold.
+    :rtype: list
+    """
+    stream = stream or sys.stdout
+    regressions = list()
+    for name, before, after, change, noise in rows:
+        limit = max(MIN_THRESHOLD, NOISE_FACTOR * noise) if threshold is None else threshold
+        flag = ''
+        if change > limit:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print('{0:<90} {1:>12.6f}s {2:>12.6f}s {3:>+8.1f}% (limit {4:.1f}%){5}'.format(
+            name, before, after, change, limit, flag), file=stream)
+    limit = 'their noise' if threshold is None else '{0}%'.format(threshold)
+    print('{0} scenarios compared, {1} regressed more than {2}.'.format(len(rows), len(regressions), limit),
+          file=stream)
+    return regressions
+
+
+def load(path):
+    """Load a JSON report.
+
+    :param str path: File path.
+
+    :return: Report.
+    :rtype: dict
+    """
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def main(argv=None):
+    """Main function.
+
+    :param list argv: Arguments (defaults to sys.argv[1:]).
+
+    :return: Exit status. 1 if any scenario regressed.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description='Compare terminaltables benchmark results.')
+    parser.add_argument('baseline', help='baseline JSON report')
+    parser.add_argument('current', help='JSON report to check')
+    parser.add_argument('-t', '--threshold', type=float,
+                        help='tolerated slowdown in percent (default: sized to the noise of both runs)')
+    args = parser.parse_args(argv)
+    rows = compare(load(args.baseline), load(args.current))
+    return 1 if print_comparison(rows, args.threshold) else 0
+
+
+if __name__ == '__main__':
+    if __package__ is None:
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.exit(main())
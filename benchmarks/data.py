@@ -0,0 +1,66 @@
+# coding: utf-8
+"""Generate deterministic table data for benchmarks."""
+
+import random
+
+ASCII_WORDS = ('alpha', 'bravo', 'charlie', 'hostname-42.example.com', 'OK', 'FAILED', '3.14159', 'pending', '')
+CJK_WORDS = (u'蓝色', u'世界你好', u'东京', u'データベース', u'서울', u'ok', u'')
+CONTENT_TYPES = ('ascii', 'cjk', 'ansi')
+LINE_TYPES = ('single', 'multi')
+SHAPES = {'narrow': 3, 'wide': 20}
+
+
+def gen_cell(rand, content, lines):
+    """Generate one cell.
+
+    :param random.Random rand: Random number generator.
+    :param str content: One of CONTENT_TYPES.
+    :param str lines: One of LINE_TYPES.
+
+    :return: Cell contents.
+    :rtype: str
+    """
+    words = CJK_WORDS if content == 'cjk' else ASCII_WORDS
+    count = rand.randint(1, 3) if lines == 'multi' else 1
+    cell_lines = list()
+    for _ in range(count):
+        word = rand.choice(words)
+        if content == 'ansi' and word:
+            word = '\033[3{0}m{1}\033[39m'.format(rand.randint(1, 7), word)
+        cell_lines.append(word)
+    return '\n'.join(cell_lines)
+
+
+def gen_table(rows, shape='narrow', content='ascii', lines='single', seed=0):
+    """Generate table data: a heading row followed by `rows` rows.
+
+    :param int rows: Number of data rows.
+    :param str shape: Key of SHAPES (number of columns).
+    :param str content: One of CONTENT_TYPES.
+    :param str lines: One of LINE_TYPES.
+    :param int seed: Random seed, same seed means same data.
+
+    :return: List of lists of strings.
+    :rtype: list
+    """
+    rand = random.Random(seed)
+    columns = SHAPES[shape]
+    table_data = [['Column {0}'.format(i) for i in range(columns)]]
+    for _ in range(rows):
+        table_data.append([gen_cell(rand, content, lines) for _ in range(columns)])
+    return table_data
+
+
+def gen_cells(count, content='ascii', lines='single', seed=0):
+    """Generate a flat list of cells.
+
+    :param int count: Number of cells.
+    :param str content: One of CONTENT_TYPES.
+    :param str lines: One of LINE_TYPES.
+    :param int seed: Random seed, same seed means same data.
+
+    :return: List of strings.
+    :rtype: list
+    """
+    rand = random.Random(seed)
+    return [gen_cell(rand, content, lines) for _ in range(count)]
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""Time the render pipeline and write results to JSON.
+
+Usage: python -m benchmarks.run [--sizes 10,1000,100000,1000000] [--filter AsciiTable] [--output results.json]
+                                [--repeat 7] [--baseline benchmarks/baseline.json [--threshold 10]]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+if __name__ == '__main__' and __package__ is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.compare import compare, load, median, print_comparison  # noqa pylint: disable=wrong-import-position
+from benchmarks.scenarios import gen_scenarios  # noqa pylint: disable=wrong-import-position
+import terminaltables  # noqa pylint: disable=wrong-import-position
+
+DEFAULT_REPEAT = 7  # Enough measurements for a stable median and noise estimate.
+DEFAULT_SIZES = (10, 1000, 100000)
+MIN_TIME = 0.2  # Seconds. Fast scenarios are called repeatedly until one measurement takes at least this long.
+
+
+def calibrate(repeat=DEFAULT_REPEAT):
+    """Time a fixed pure-Python workload to gauge the speed of this machine and interpreter.
+
+    Loops, string formatting, padding, joining, and dict lookups, like the render pipeline.
+
+    :param int repeat: Number of measurements.
+
+    :return: Median seconds and noise in percent, like time_scenario().
+    :rtype: tuple
+    """
+    def workload():
+        """Busy work."""
+        lookup = dict((i, str(i)) for i in range(100))
+        for i in range(20000):
+            cells = [lookup[(i + j) % 100].ljust(8) for j in range(5)]
+            '|'.join(cells).count('1')
+    timing = time_scenario(workload, repeat)
+    return timing['median'], timing['noise']
+
+
+def time_scenario(func, repeat):
+    """Time a callable.
+
+    :param func: Callable to time.
+    :param int repeat: Number of measurements to take.
+
+    :return: Dictionary with the best, mean, and median seconds per call, noise (median absolute deviation in percent
+        of the median), number of calls per measurement, and repeat.
+    :rtype: dict
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_TIME or number >= 1000000:
+            break
+        number *= 10 if elapsed < MIN_TIME / 10 else 2
+
+    timings = [elapsed] + timer.repeat(repeat - 1, number) if repeat > 1 else [elapsed]
+    per_call = [t / number for t in timings]
+    middle = median(per_call)
+    noise = median([abs(t - middle) for t in per_call]) / middle * 100
+    return dict(best=min(per_call), mean=sum(per_call) / len(per_call), median=middle, noise=noise, number=number,
+                repeat=repeat)
+
+
+def run(sizes, name_filter=None, repeat=DEFAULT_REPEAT, stream=sys.stderr):
+    """Run every matching scenario.
+
+    :param iter sizes: Row counts to benchmark tables with.
+    :param str name_filter: Only run scenarios with this substring in their names.
+    :param int repeat: Number of measurements per scenario.
+    :param stream: Progress is written here (None for silence).
+
+    :return: Report with "meta" and "results" keys, ready for json.dump().
+    :rtype: dict
+    """
+    results = list()
+    for scenario in gen_scenarios(sizes):
+        if name_filter and name_filter not in scenario.name:
+            continue
+        timing = time_scenario(scenario.setup(), repeat)
+        timing.update(name=scenario.name, params=scenario.params)
+        results.append(timing)
+        if stream:
+            print('{0:<90} {1:>12.6f}s {2:>6.1f}%'.format(scenario.name, timing['median'], timing['noise']),
+                  file=stream)
+
+    calibration, calibration_noise = calibrate(repeat)
+    meta = dict(
+        calibration=calibration,
+        calibration_noise=calibration_noise,
+        implementation=platform.python_implementation(),
+        machine=platform.machine(),
+        platform=platform.platform(),
+        python=platform.python_version(),
+        terminaltables=terminaltables.__version__,
+        timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'),
+    )
+    return dict(meta=meta, results=results)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments.
+
+    :param list argv: Arguments (defaults to sys.argv[1:]).
+
+    :return: Parsed arguments.
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description='Benchmark terminaltables.')
+    parser.add_argument('-b', '--baseline', help='compare against this JSON report, exit 1 on regressions')
+    parser.add_argument('-f', '--filter', help='only run scenarios with this substring in their names')
+    parser.add_argument('-o', '--output', help='write JSON results to this file (default: stdout)')
+    parser.add_argument('-r', '--repeat', default=DEFAULT_REPEAT, type=int,
+                        help='measurements per scenario (default: %(default)s)')
+    parser.add_argument('-t', '--threshold', type=float,
+                        help='tolerated slowdown against the baseline in percent (default: sized to the noise)')
+    parser.add_argument('-s', '--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='comma separated table row counts (default: %(default)s)')
+    args = parser.parse_args(argv)
+    args.sizes = [int(s) for s in args.sizes.split(',') if s]
+    return args
+
+
+def main(argv=None):
+    """Main function.
+
+    :param list argv: Arguments (defaults to sys.argv[1:]).
+
+    :return: Exit status.
+    :rtype: int
+    """
+    args = parse_args(argv)
+    report = run(args.sizes, args.filter, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+    elif not args.baseline:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.baseline:
+        return 1 if print_comparison(compare(load(args.baseline), report), args.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Benchmark scenarios: what to time and with which inputs."""
+
+import os
+import subprocess
+import sys
+
+from benchmarks.data import CONTENT_TYPES, gen_cells, gen_table, LINE_TYPES, SHAPES
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+from terminaltables.width_and_alignment import align_and_pad_cell, max_dimensions, visible_width
+
+CELL_COUNT = 10000  # Cells per visible_width() and align_and_pad_cell() scenario.
+IMPORTS = (  # Code run in a new interpreter by import scenarios.
+    ('python', 'pass'),  # Interpreter startup alone, for reference.
+    ('terminaltables', 'import terminaltables'),
+    ('AsciiTable', 'from terminaltables import AsciiTable; AsciiTable([["a"]]).table'),
+    ('SingleTable', 'from terminaltables import SingleTable; SingleTable([[u"\\u4e16"]]).table'),
+)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Scenario(object):
+    """One thing to time with one set of inputs."""
+
+    def __init__(self, name, params, setup):
+        """Constructor.
+
+        :param str name: Unique name, also used for filtering and comparing runs.
+        :param dict params: Inputs that make up this scenario (for the JSON report).
+        :param setup: Callable building the inputs (untimed). Returns the callable to time.
+        """
+        self.name = name
+        self.params = params
+        self.setup = setup
+
+
+def _render(cls, table_data):
+    """Return a callable rendering a table.
+
+    :param cls: Table class.
+    :param list table_data: Table data.
+
+    :return: Callable to time.
+    """
+    table = cls(table_data)
+    return lambda: table.table
+
+
+def _max_dimensions(table_data):
+    """Return a callable measuring a table.
+
+    :param list table_data: Table data.
+
+    :return: Callable to time.
+    """
+    return lambda: max_dimensions(table_data)
+
+
+def _visible_width(cells):
+    """Return a callable measuring every cell line.
+
+    :param list cells: List of strings.
+
+    :return: Callable to time.
+    """
+    lines = [line for cell in cells for line in cell.splitlines()]
+    return lambda: [visible_width(line) for line in lines]
+
+
+def _align_and_pad_cell(cells):
+    """Return a callable aligning and padding every cell.
+
+    :param list cells: List of strings.
+
+    :return: Callable to time.
+    """
+    return lambda: [align_and_pad_cell(c, ('center',), (30, 3), (1, 1, 0, 0)) for c in cells]
+
+
+def _import(code):
+    """Return a callable running code in a new interpreter that imports terminaltables from this checkout.
+
+    :param str code: Python statements.
+
+    :return: Callable to time.
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    return lambda: subprocess.check_call([sys.executable, '-c', code], env=env)
+
+
+def gen_scenarios(sizes):
+    """Yield every scenario.
+
+    Every table class is timed on single-line ASCII tables. AsciiTable and max_dimensions() are also timed for every
+    combination of shape, content, and lines. Import scenarios time a new interpreter importing terminaltables (and
+    rendering a one cell table) to catch import time regressions.
+
+    :param iter sizes: Row counts to benchmark tables with.
+
+    :return: Yields Scenario instances.
+    """
+    for rows in sizes:
+        for shape in sorted(SHAPES):
+            for content in CONTENT_TYPES:
+                for lines in LINE_TYPES:
+                    params = dict(rows=rows, shape=shape, content=content, lines=lines)
+                    suffix = '/rows={rows}/shape={shape}/content={content}/lines={lines}'.format(**params)
+                    data = lambda p=params: gen_table(p['rows'], p['shape'], p['content'], p['lines'])
+
+                    for cls in (AsciiTable, UnixTable, GithubFlavoredMarkdownTable):
+                        if cls is not AsciiTable and (content, lines) != ('ascii', 'single'):
+                            continue
+                        setup = lambda c=cls, d=data: _render(c, d())
+                        yield Scenario(cls.__name__ + '.table' + suffix, dict(params, target=cls.__name__), setup)
+
+                    setup = lambda d=data: _max_dimensions(d())
+                    yield Scenario('max_dimensions' + suffix, dict(params, target='max_dimensions'), setup)
+
+    for content in CONTENT_TYPES:
+        for lines in LINE_TYPES:
+            params = dict(cells=CELL_COUNT, content=content, lines=lines)
+            suffix = '/cells={cells}/content={content}/lines={lines}'.format(**params)
+            cells = lambda p=params: gen_cells(p['cells'], p['content'], p['lines'])
+            yield Scenario('visible_width' + suffix, dict(params, target='visible_width'),
+                           lambda c=cells: _visible_width(c()))
+            yield Scenario('align_and_pad_cell' + suffix, dict(params, target='align_and_pad_cell'),
+                           lambda c=cells: _align_and_pad_cell(c()))
+
+    for name, code in IMPORTS:
+        yield Scenario('import/' + name, dict(code=code, target='import'), lambda c=code: _import(c))
@@ -51,6 +51,7 @@ setup(
         'Topic :: Text Processing :: Markup',
     ],
     description='Generate simple tables in terminals from a nested list of strings.',
+    extras_require={'numpy': ['numpy']},
     install_requires=[],
     keywords='Shell Bash ANSI ASCII terminal tables',
     license='MIT',
@@ -2,15 +2,54 @@
 
 Use SingleTable or DoubleTable instead of AsciiTable for box-drawing characters.
 
+Table classes are imported on first access (Python 3.7+) so importing this package is nearly free for programs that
+may not render a table.
+
 https://github.com/Robpol86/terminaltables
 https://pypi.python.org/pypi/terminaltables
 """
 
-from terminaltables.tables import AsciiTable  # noqa
-from terminaltables.tables import DoubleTable  # noqa
-from terminaltables.tables import GithubFlavoredMarkdownTable  # noqa
-from terminaltables.tables import SingleTable  # noqa
+import importlib
+import sys
 
+__all__ = ('AsciiTable', 'DoubleTable', 'GithubFlavoredMarkdownTable', 'SingleTable')
 __author__ = '@Robpol86'
 __license__ = 'MIT'
 __version__ = '2.1.0'
+
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562), import eagerly.
+    from terminaltables.tables import AsciiTable  # noqa
+    from terminaltables.tables import DoubleTable  # noqa
+    from terminaltables.tables import GithubFlavoredMarkdownTable  # noqa
+    from terminaltables.tables import SingleTable  # noqa
+else:
+    def __getattr__(name):
+        """Import terminaltables.tables when one of its classes is first accessed, or a submodule accessed by name.
+
+        Submodules used to be attributes after a plain `import terminaltables` because the table classes were imported
+        eagerly, so they're imported on access to keep e.g. `terminaltables.width_and_alignment` working.
+
+        :param str name: Attribute name.
+
+        :return: Table class or submodule.
+        """
+        if name not in __all__:
+            module_name = '{0}.{1}'.format(__name__, name)
+            if not name.startswith('__'):
+                try:
+                    return importlib.import_module(module_name)
+                except ImportError as error:
+                    if getattr(error, 'name', None) != module_name:  # Submodule exists but failed to import.
+                        raise
+            raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+        from terminaltables import tables
+        value = globals()[name] = getattr(tables, name)
+        return value
+
+    def __dir__():
+        """Include the table classes before they're imported.
+
+        :return: Attribute names.
+        :rtype: list
+        """
+        return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,11 @@
 """Main table class."""
 
+from itertools import chain, count, islice
+
 from terminaltables import width_and_alignment
-from terminaltables.build import build_border, build_row
+from terminaltables.build import build_border, build_row, RowTemplate
+from terminaltables.cache import LRUCache
+from terminaltables.layout import Layout
 from terminaltables.terminal_io import terminal_size
 
 
@@ -29,16 +33,43 @@ class BaseTable(object):
         self.table_data = table_data
         self.title = title
 
+        self.fixed_column_widths = None  # [10, 20, 5] to stream table_data (any iterable) without measuring it.
         self.inner_column_border = True
         self.inner_heading_row_border = True
         self.inner_footing_row_border = False
         self.inner_row_border = False
         self.justify_columns = dict()  # {0: 'right', 1: 'left', 2: 'center'}
         self.outer_border = True
+        self.overflow = 'truncate'  # or 'ellipsis', 'wrap', 'widen'. Handles cells wider than fixed/sampled widths.
         self.padding_left = 1
         self.padding_right = 1
+        self.profiler = None  # terminaltables.profiling.Profiler instance to time each phase of rendering.
+        self.row_cache = None  # terminaltables.cache.LRUCache instance to reuse lines of rows rendered before.
+        self.sample_rows = None  # Measure only this many rows of table_data (any iterable) then stream the rest.
+
+        self._border_cache = LRUCache(8)
+        self._layout_cache = (None, None, None)  # table_data, key (see measure()), and Layout reused while they match.
+
+    def __getstate__(self):
+        """Return attributes to pickle or deep copy, without private caches (the border cache holds a lock).
+
+        :return: Copy of the instance's __dict__.
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        del state['_border_cache'], state['_layout_cache']
+        return state
+
+    def __setstate__(self, state):
+        """Restore pickled or deep copied attributes, starting with empty private caches.
+
+        :param dict state: Attributes from __getstate__().
+        """
+        self.__dict__.update(state)
+        self._border_cache = LRUCache(8)
+        self._layout_cache = (None, None, None)
 
-    def gen_cell_lines(self, row, widths, height):
+    def gen_cell_lines(self, row, widths, height, measured_row=None):
         r"""Combine cells in row and group them into lines with borders.
 
         Caller is expected to pass yielded lines to ''.join() to combine them into a printable line. Caller must append
@@ -62,6 +93,7 @@ class BaseTable(object):
         :param iter row: One row in the table. List of cells.
         :param iter widths: List of inner widths (no padding) for each column.
         :param int height: Inner height (no padding) (number of lines) to expand row to.
+        :param iter measured_row: Optional measure_cell() results for each cell, to avoid measuring them again.
 
         :return: Yields lines split into components in a list. Caller must ''.join() line.
         """
@@ -76,7 +108,9 @@ class BaseTable(object):
             align = (self.justify_columns.get(i),)
             inner_dimensions = (widths[i], height)
             padding = (self.padding_left, self.padding_right, 0, 0)
-            cells_in_row.append(width_and_alignment.align_and_pad_cell(cell, align, inner_dimensions, padding))
+            measured = measured_row[i] if measured_row and i < len(measured_row) else None
+            cells_in_row.append(width_and_alignment.align_and_pad_cell(cell, align, inner_dimensions, padding, ' ',
+                                                                       measured))
 
         # Combine cells and borders.
         lines = build_row(
@@ -98,84 +132,396 @@ class BaseTable(object):
         :return: The max width of the column.
         :rtype: int
         """
-        outer_border = 2 if self.outer_border else 0
-        inner_border = 1 if self.inner_column_border else 0
-        padding = self.padding_left + self.padding_right
-        return width_and_alignment.column_max_width(self.table_data, column_number, outer_border, inner_border, padding)
+        terminal_width = width_and_alignment.terminal_size()[0]  # Looked up there like before the Layout class.
+        return self.layout.column_max_width(column_number, terminal_width)
 
     @property
     def column_widths(self):
         """Return a list of integers representing the widths of each table column without padding."""
-        if not self.table_data:
-            return list()
-        return width_and_alignment.max_dimensions(self.table_data)[0]
+        return self.layout.inner_widths
 
-    @property
-    def ok(self):  # Too late to change API. # pylint: disable=invalid-name
-        """Return True if the table fits within the terminal width, False if the table breaks."""
-        return self.table_width <= terminal_size()[0]
+    def compile_row(self, widths=None):
+        """Compile a reusable row formatter for this table's justification, padding, and borders.
 
-    @property
-    def table(self):
-        """Return a large string of the entire table ready to be printed to the terminal."""
-        widths = [c + self.padding_left + self.padding_right for c in self.column_widths]
-        inner_widths, inner_heights = width_and_alignment.max_dimensions(self.table_data)
-        final_table_data = list()
+        Use it to render many rows (or many small tables with the same shape) without going through gen_cell_lines()
+        for every cell. The template doesn't follow later changes to the table's attributes.
+
+        :param iter widths: List of inner widths (no padding) for each column. Defaults to column_widths.
+
+        :return: Row formatter. Call its format() method with a row to get printable lines, or format_plain() to get the
+            only line of a row of single-line plain ASCII cells (see Layout.plain).
+        :rtype: terminaltables.build.RowTemplate
+        """
+        return RowTemplate(
+            self.column_widths if widths is None else widths,
+            self.justify_columns,
+            (self.padding_left, self.padding_right),
+            (
+                self.CHAR_VERTICAL if self.outer_border else '',
+                self.CHAR_VERTICAL if self.inner_column_border else '',
+                self.CHAR_VERTICAL if self.outer_border else '',
+            ),
+        )
+
+    def row_renderer(self, layout, gen_cell_lines=None, join=''.join):
+        """Return a function that renders one row into printable lines, reusing them from row_cache if it's set.
+
+        Cached lines are keyed on the row's cells, its height, column widths, justification, padding, and vertical
+        borders, so one cache can be shared between tables. Plain tables (single-line ASCII cells) are rendered from a
+        compiled template (see compile_row()) which is about as fast as a cache lookup, so they don't use the cache.
+
+        :param Layout layout: Layout of the table being rendered.
+        :param gen_cell_lines: Replacement for the gen_cell_lines() method (e.g. wrapped by the profiler).
+        :param join: Function joining the components of a line.
+
+        :return: Function taking a row, column widths, inner height, and the row's index in table_data.
+        """
+        gen_cell_lines = gen_cell_lines or self.gen_cell_lines
+
+        def render_row(row, widths, height, index):
+            """Render a row.
+
+            :param list row: Cells.
+            :param list widths: Inner widths of each column.
+            :param int height: Inner height to expand the row to.
+            :param int index: Index of the row in table_data, to look up its measured cells in the layout.
+
+            :return: Printable lines.
+            :rtype: tuple
+            """
+            measured_row = layout.cells[index] if layout.cells is not None else None
+            return tuple(join(line) for line in gen_cell_lines(row, widths, height, measured_row))
+
+        row_cache = self.row_cache
+        if row_cache is None:
+            return render_row
 
-        # Append top border.
+        settings = (
+            self.CHAR_VERTICAL if self.outer_border else '',
+            self.CHAR_VERTICAL if self.inner_column_border else '',
+            self.padding_left,
+            self.padding_right,
+            tuple(sorted(self.justify_columns.items())),
+        )
+        widths_keys = [None, None]  # Last widths list seen and its key, widths rarely change between rows.
+
+        def render_cached(row, widths, height, index):
+            """Return cached lines of a row, or render and cache them.
+
+            :param list row: Cells.
+            :param list widths: Inner widths of each column.
+            :param int height: Inner height to expand the row to.
+            :param int index: Index of the row in table_data.
+
+            :return: Printable lines.
+            :rtype: tuple
+            """
+            if widths is not widths_keys[0]:
+                widths_keys[:] = [widths, tuple(widths)]
+            key = (settings, widths_keys[1], height, tuple(row))
+            lines = row_cache.get(key)
+            if lines is None:
+                lines = render_row(row, widths, height, index)
+                row_cache.put(key, lines)
+            return lines
+
+        return render_cached
+
+    def gen_rows(self, layout, start=0):
+        """Yield each row of table_data with the inner height to expand it to and the column widths to render it with.
+
+        Without row heights in the layout (fixed or sampled column widths), table_data is iterated only once (it may be
+        a generator) and over-wide cells are handled according to `overflow`. With 'widen' the yielded widths grow to
+        fit such cells, and columns are added for cells past the last one; in every other case the same widths list is
+        yielded for all rows and such cells are dropped.
+
+        :param Layout layout: Layout of the table being rendered.
+        :param int start: Index of the first row to yield. Rows before it are skipped without being read if table_data
+            is a sequence.
+
+        :return: Yields 3-item tuples: row (list of cells), inner height, and inner column widths.
+        """
+        widths = layout.inner_widths
+        if layout.inner_heights is not None:
+            for i in range(start, len(layout.inner_heights)):
+                yield self.table_data[i], layout.inner_heights[i], widths
+            return
+
+        rows = self.table_data
+        if start:
+            try:
+                rows = (self.table_data[i] for i in range(start, len(self.table_data)))
+            except TypeError:  # Not a sequence (e.g. a generator).
+                rows = islice(self.table_data, start, None)
+
+        for row in rows:
+            if self.overflow == 'widen':
+                row = list(row)
+                needed = width_and_alignment.max_dimensions([row])[0]
+                if len(needed) > len(widths) or any(n > w for n, w in zip(needed, widths)):
+                    widths = [max(n, w) for n, w in zip(needed, widths)] + widths[len(needed):] + needed[len(widths):]
+            else:
+                row = list(islice(row, len(widths)))
+                row = [width_and_alignment.fit_cell(c, w, self.overflow) for c, w in zip(row, widths)]
+            yield row, max([c.count('\n') + 1 for c in row if c] or [0]), widths
+
+    def iter_lines(self, start=0, stop=None, layout=None, heading=False):
+        """Yield each line of the table (borders and rows) as soon as it is built, without trailing newlines.
+
+        Unlike the `table` property the whole table is never held in memory as one string, nor are the measurements of
+        every cell (unless the given layout kept them).
+
+        Rendering only some rows (see render_range()) gives the same lines as rendering the whole table would for those
+        rows, between the top and bottom borders. Pass a layout taken beforehand to skip measuring table_data, so the
+        work done is proportional to the number of rows rendered. The layout must still match table_data.
+
+        :param int start: Index of the first row to render.
+        :param int stop: Index after the last row to render. None renders the rest of the table.
+        :param Layout layout: Layout of the whole table (e.g. from the `layout` property) to render with.
+        :param bool heading: Render the first (heading) row and its border above the others if start is past it. Needs
+            table_data to be a sequence.
+
+        :return: Yields printable lines.
+        """
+        if start < 0 or (stop is not None and stop < start):
+            raise ValueError('Invalid row range: {0}:{1}'.format(start, stop))
+
+        # Time each phase if profiling, otherwise call straight through.
+        measure, gen_cell_lines, border, join = self.measure, self.gen_cell_lines, self.border, ''.join
+        if self.profiler:
+            measure = self.profiler.wrap('max_dimensions', measure)
+            gen_cell_lines = self.profiler.wrap('gen_cell_lines', lambda *a: list(self.gen_cell_lines(*a)))
+            border = self.profiler.wrap('build_border', border)
+            join = self.profiler.wrap('join', join)
+
+        if layout is None:
+            layout = measure()  # Without kept cell measurements, which would last (and grow) until the render ends.
+        render_row = self.row_renderer(layout, gen_cell_lines, join)
+        drawn = layout.inner_widths  # Column widths of the last yielded line.
+        separators = dict()  # Every separator with the same widths is the same string, build it once.
+
+        def separator(inner_widths):
+            """Return the border between two rows.
+
+            :param list inner_widths: Column widths of the row below the separator.
+
+            :return: Printable line.
+            :rtype: str
+            """
+            key = tuple(inner_widths)
+            if key not in separators:
+                separators[key] = border('separator', [layout.padding + w for w in inner_widths])
+            return separators[key]
+
+        # Yield top border.
         if self.outer_border:
-            final_table_data.append(''.join(build_border(
-                widths,
+            yield border('top', layout.outer_widths)
+
+        # Yield table body. Look two rows ahead to find the last and second to last rows.
+        template = self.compile_row(drawn) if layout.plain else None
+        format_plain = template and template.format_plain
+        if template and self.profiler:
+            format_plain = self.profiler.wrap('gen_cell_lines', format_plain)
+        rows, indexes = self.gen_rows(layout, start), count(start)  # Row and its index in table_data.
+        remaining = None if stop is None else stop - start  # Rows left to render.
+        if heading and start:
+            rows, indexes = chain(islice(self.gen_rows(layout), 1), rows), chain([0], indexes)
+            remaining = None if stop is None else remaining + 1
+        pending = list(islice(rows, 2))
+        while pending and remaining != 0:
+            row, height, inner_widths = pending.pop(0)
+            pending.extend(islice(rows, 1))
+            i = next(indexes)
+            remaining = None if remaining is None else remaining - 1
+
+            # Yield another separator if columns were widened since the last one.
+            if inner_widths != drawn:
+                drawn = inner_widths
+                yield separator(drawn)
+
+            if template:
+                yield format_plain(row)
+            else:
+                for line in render_row(row, inner_widths, height, i):
+                    yield line
+
+            # Yield row separator.
+            if not pending or remaining == 0:
+                break  # Last row of the table or of the range.
+            if self.inner_row_border or (self.inner_heading_row_border and i == 0):
+                drawn = pending[0][2]
+                yield separator(drawn)
+
+            if len(pending) == 1 and self.inner_footing_row_border:
+                drawn = pending[0][2]
+                yield separator(drawn)
+
+        # Yield bottom border.
+        if self.outer_border:
+            yield border('bottom', [layout.padding + w for w in drawn])
+
+    def border(self, kind, widths):
+        """Return the top, bottom, or row separator border as a printable line.
+
+        Borders are cached (a few per table instance) keyed on widths and border characters, so re-rendering a table
+        with unchanged widths reuses the same strings.
+
+        :param str kind: One of 'top', 'bottom', or 'separator'.
+        :param iter widths: List of outer widths (with padding) for each column.
+
+        :return: Printable line.
+        :rtype: str
+        """
+        if kind == 'top':
+            characters = (
                 self.CHAR_HORIZONTAL,
                 self.CHAR_CORNER_UPPER_LEFT,
                 self.CHAR_INTERSECT_TOP if self.inner_column_border else '',
                 self.CHAR_CORNER_UPPER_RIGHT,
-                self.title
-            )))
-
-        # Build table body.
-        indexes = range(len(self.table_data))
-        for i in indexes:
-            for line in self.gen_cell_lines(self.table_data[i], inner_widths, inner_heights[i]):
-                final_table_data.append(''.join(line))
-
-            # Insert row separator.
-            if i == indexes[-1]:
-                continue  # Last row.
-            if self.inner_row_border or (self.inner_heading_row_border and i == 0):
-                final_table_data.append(''.join(build_border(
-                    widths,
-                    self.CHAR_HORIZONTAL,
-                    self.CHAR_INTERSECT_LEFT if self.outer_border else '',
-                    self.CHAR_INTERSECT_CENTER if self.inner_column_border else '',
-                    self.CHAR_INTERSECT_RIGHT if self.outer_border else ''
-                )))
-
-            if i == indexes[-2] and self.inner_footing_row_border:
-                final_table_data.append(''.join(build_border(
-                    widths,
-                    self.CHAR_HORIZONTAL,
-                    self.CHAR_INTERSECT_LEFT if self.outer_border else '',
-                    self.CHAR_INTERSECT_CENTER if self.inner_column_border else '',
-                    self.CHAR_INTERSECT_RIGHT if self.outer_border else ''
-                )))
-
-        # Append bottom border.
-        if self.outer_border:
-            final_table_data.append(''.join(build_border(
-                widths,
+                self.title,
+            )
+        elif kind == 'bottom':
+            characters = (
                 self.CHAR_HORIZONTAL,
                 self.CHAR_CORNER_LOWER_LEFT,
                 self.CHAR_INTERSECT_BOTTOM if self.inner_column_border else '',
-                self.CHAR_CORNER_LOWER_RIGHT
-            )))
+                self.CHAR_CORNER_LOWER_RIGHT,
+            )
+        else:
+            characters = (
+                self.CHAR_HORIZONTAL,
+                self.CHAR_INTERSECT_LEFT if self.outer_border else '',
+                self.CHAR_INTERSECT_CENTER if self.inner_column_border else '',
+                self.CHAR_INTERSECT_RIGHT if self.outer_border else '',
+            )
+
+        key = (tuple(widths),) + characters
+        line = self._border_cache.get(key)
+        if line is None:
+            line = ''.join(build_border(widths, *characters))
+            self._border_cache.put(key, line)
+        return line
+
+    def measure(self, keep_cells=False):
+        """Measure table_data and return a new Layout instance.
+
+        With fixed_column_widths set table_data isn't read at all, with sample_rows only the first rows are measured.
+        Either way row heights are None (unknown until rendered).
+
+        If table_data has a version number that changes whenever it's modified (e.g. table_data.TableData) the layout is
+        reused until table_data or the settings it depends on change. Plain lists are measured every time.
+
+        :param bool keep_cells: Keep each cell's split lines and their widths in the layout for rendering.
+
+        :return: Layout of the table.
+        :rtype: Layout
+        """
+        version = getattr(self.table_data, 'version', None)
+        if version is None:
+            return self._measure(keep_cells)
+
+        key = (
+            version,
+            self.padding_left + self.padding_right,
+            self.outer_border,
+            self.inner_column_border,
+            None if self.fixed_column_widths is None else tuple(self.fixed_column_widths),
+            self.sample_rows,
+        )
+        if self._layout_cache[0] is not self.table_data or self._layout_cache[1] != key:
+            self._layout_cache = (self.table_data, key, self._measure(keep_cells))
+        return self._layout_cache[2]
+
+    def _measure(self, keep_cells):
+        """Measure table_data and return a new Layout instance, without caching.
+
+        :param bool keep_cells: Keep each cell's split lines and their widths in the layout for rendering.
+
+        :return: Layout of the table.
+        :rtype: Layout
+        """
+        if self.fixed_column_widths is not None or self.sample_rows is not None:
+            return Layout(
+                list(self.fixed_column_widths or self.sample_column_widths()),
+                None,
+                self.padding_left + self.padding_right,
+                2 if self.outer_border else 0,
+                1 if self.inner_column_border else 0,
+            )
+        return Layout.measure(
+            self.table_data,
+            self.padding_left + self.padding_right,
+            2 if self.outer_border else 0,
+            1 if self.inner_column_border else 0,
+            keep_cells,
+        )
+
+    def sample_column_widths(self):
+        """Measure the first `sample_rows` rows of table_data and return their column widths without padding.
+
+        If table_data is an iterator (e.g. a generator) it's replaced with an equivalent one so no rows are lost.
+
+        :raise ValueError: If sample_rows is less than 1 (every cell would be cut off).
+
+        :return: List of column widths.
+        :rtype: list
+        """
+        if self.sample_rows < 1:
+            raise ValueError('Invalid sample_rows: {0!r}'.format(self.sample_rows))
+        rows = iter(self.table_data)
+        sample = list(islice(rows, self.sample_rows))
+        if rows is self.table_data:
+            self.table_data = chain(sample, rows)
+        return width_and_alignment.max_dimensions(sample)[0]
 
-        return '\n'.join(final_table_data)
+    def render_range(self, start, stop, layout=None, heading=False):
+        """Return rows start to stop (excluded) as a table string, with the column widths of the whole table.
+
+        For scrolling through large tables: hold on to the `layout` property (re-read it after changing table_data) and
+        pass it here so each page only renders its own rows. See iter_lines() for details.
+
+        :param int start: Index of the first row to render.
+        :param int stop: Index after the last row to render. None renders the rest of the table.
+        :param Layout layout: Layout of the whole table to render with. Measured if not given.
+        :param bool heading: Render the first (heading) row above the others if start is past it.
+
+        :return: Printable table.
+        :rtype: str
+        """
+        return '\n'.join(self.iter_lines(start, stop, layout, heading))
+
+    def write(self, stream):
+        """Write the table to a file-like object one line at a time. Same output as print(table.table).
+
+        :param stream: File-like object with a write() method (e.g. sys.stdout or an open file).
+        """
+        for line in self.iter_lines():
+            stream.write(line + '\n')
+
+    @property
+    def layout(self):
+        """Return a Layout instance measuring table_data (column widths, row heights, and total width) in one pass.
+
+        Callers needing more than one dimension should hold on to the returned object instead of re-reading the
+        property, since table_data may have been mutated in place between reads (unless it's versioned, see measure()).
+        """
+        return self.measure()
+
+    @property
+    def ok(self):  # Too late to change API. # pylint: disable=invalid-name
+        """Return True if the table fits within the terminal width, False if the table breaks."""
+        return self.table_width <= terminal_size()[0]
+
+    @property
+    def table(self):
+        """Return a large string of the entire table ready to be printed to the terminal."""
+        # The whole table is held in memory anyway, so cells measured once are reused when rendering them.
+        if self.profiler:
+            layout = self.profiler.wrap('max_dimensions', self.measure)(keep_cells=True)
+            return self.profiler.wrap('join', '\n'.join)(list(self.iter_lines(layout=layout)))
+        return '\n'.join(self.iter_lines(layout=self.measure(keep_cells=True)))
 
     @property
     def table_width(self):
         """Return the width of the table including padding and borders."""
-        outer_border = 2 if self.outer_border else 0
-        inner_border = 1 if self.inner_column_border else 0
-        padding = self.padding_left + self.padding_right
-        return width_and_alignment.table_width(self.table_data, outer_border, inner_border, padding)
+        return self.layout.table_width
@@ -1,6 +1,7 @@
 """Combine cells into rows."""
 
-from terminaltables.width_and_alignment import visible_width
+from terminaltables import counters
+from terminaltables.width_and_alignment import align_and_pad_cell, is_ascii, RE_ASCII_CONTROL, visible_width
 
 
 def combine(line, left, intersect, right):
@@ -68,6 +69,8 @@ def build_border(column_widths, horizontal, left, intersect, right, title=None):
     :return: Prepared border as a tuple of strings.
     :rtype: tuple
     """
+    if counters.ACTIVE is not None:
+        counters.ACTIVE.build_border_calls += 1
     length = 0
 
     # Hide title if it doesn't fit.
@@ -135,3 +138,78 @@ def build_row(row, left, center, right):
     for row_index in range(len(row[0])):
         combined.append(tuple(combine((c[row_index] for c in row), left, center, right)))
     return combined
+
+
+class RowTemplate(object):
+    """Row formatter compiled once for a fixed set of column widths, justifications, padding, and borders.
+
+    Rows of single-line ASCII cells (the common case) are rendered with one str.format() call. Any other row falls back
+    to align_and_pad_cell() and build_row(), with the same output.
+    """
+
+    def __init__(self, widths, justify_columns, padding, borders):
+        """Constructor.
+
+        :param iter widths: List of inner widths (no padding) for each column.
+        :param dict justify_columns: Column numbers (0 base) mapped to 'left', 'right', or 'center'.
+        :param iter padding: Number of space chars for left and right (2 ints).
+        :param iter borders: Left border, column separator, and right border (3 strings).
+        """
+        self.widths = list(widths)
+        self.justify = [justify_columns.get(i) for i in range(len(self.widths))]
+        self.padding = tuple(padding)
+        self.borders = tuple(borders)
+
+        # Center with str.center() before formatting, format()'s centering puts odd spaces on the other side.
+        self.centered = [i for i, j in enumerate(self.justify) if j == 'center']
+        fields = list()
+        for i, (width, justify) in enumerate(zip(self.widths, self.justify)):
+            if justify == 'center':
+                fields.append('{%d}' % i)
+            else:
+                fields.append('{%d:%s%d}' % (i, '>' if justify == 'right' else '<', width))
+        escape = lambda string: string.replace('{', '{{').replace('}', '}}')
+        left, center, right = [escape(b) for b in self.borders]
+        pad_left, pad_right = ' ' * self.padding[0], ' ' * self.padding[1]
+        self.template = left + center.join(pad_left + f + pad_right for f in fields) + right
+        self._format = self.template.format
+
+    def format(self, row):
+        """Render one row.
+
+        :param iter row: One row in the table. List of cells (missing cells are empty).
+
+        :return: Printable lines (more than one if a cell is multi-line).
+        :rtype: list
+        """
+        row = list(row)
+        if len(row) < len(self.widths):
+            row += [''] * (len(self.widths) - len(row))
+
+        # Fast path.
+        joined = ''.join(row)
+        if is_ascii(joined) and not RE_ASCII_CONTROL.search(joined):
+            return [self.format_plain(row)]
+
+        # Multi-line, colored, or wide characters.
+        height = max([c.count('\n') + 1 for c in row if c] or [0])
+        cells = list()
+        for cell, width, justify in zip(row, self.widths, self.justify):
+            cells.append(align_and_pad_cell(cell, (justify,), (width, height), self.padding + (0, 0)))
+        return [''.join(line) for line in build_row(cells, *self.borders)]
+
+    def format_plain(self, row):
+        """Render one row of single-line ASCII cells without control characters. The caller must check that beforehand.
+
+        :param iter row: One row in the table. List of cells (missing cells are empty).
+
+        :return: Printable line.
+        :rtype: str
+        """
+        if counters.ACTIVE is not None:
+            counters.ACTIVE.padding_allocations += 1
+        if self.centered or len(row) < len(self.widths):
+            row = list(row) + [''] * (len(self.widths) - len(row))
+            for i in self.centered:
+                row[i] = row[i].center(self.widths[i])
+        return self._format(*row)
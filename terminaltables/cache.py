@@ -0,0 +1,103 @@
+"""Bounded, thread-safe least recently used cache with hit/miss statistics."""
+
+from threading import Lock
+
+PREV, NEXT, KEY, VALUE = 0, 1, 2, 3  # Fields of linked list entries.
+
+
+class LRUCache(object):
+    """Dictionary-like cache that evicts the least recently used entry once it holds `maxsize` entries.
+
+    Safe to share between threads and table instances. Entries are kept in a circular doubly linked list (most recently
+    used right before the root) so lookups, insertions, and evictions are all O(1).
+    """
+
+    def __init__(self, maxsize=4096):
+        """Constructor.
+
+        :param int maxsize: Maximum number of entries to hold.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1.')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = dict()
+        self._lock = Lock()
+        self._root = list()
+        self._root[:] = [self._root, self._root, None, None]
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def clear(self):
+        """Remove every entry and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._root[:] = [self._root, self._root, None, None]
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the cached value for `key` and mark it as most recently used. Counts a hit or a miss.
+
+        :param key: Hashable key.
+        :param default: Returned on a miss.
+
+        :return: Cached value or default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+
+            # Move entry to the most recently used end.
+            entry[PREV][NEXT], entry[NEXT][PREV] = entry[NEXT], entry[PREV]
+            root = self._root
+            last = root[PREV]
+            last[NEXT] = root[PREV] = entry
+            entry[PREV], entry[NEXT] = last, root
+            return entry[VALUE]
+
+    def put(self, key, value):
+        """Cache a value, evicting the least recently used entry if the cache is full.
+
+        :param key: Hashable key.
+        :param value: Value to cache.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries[key][VALUE] = value
+                return
+
+            root = self._root
+            if len(self._entries) >= self.maxsize:
+                oldest = root[NEXT]
+                root[NEXT], oldest[NEXT][PREV] = oldest[NEXT], root
+                del self._entries[oldest[KEY]]
+                self.evictions += 1
+
+            last = root[PREV]
+            entry = [last, root, key, value]
+            last[NEXT] = root[PREV] = self._entries[key] = entry
+
+    @property
+    def hit_rate(self):
+        """Return the fraction (0.0 to 1.0) of get() calls that were hits."""
+        lookups = self.hits + self.misses
+        return float(self.hits) / lookups if lookups else 0.0
+
+    @property
+    def stats(self):
+        """Return a dictionary of hits, misses, evictions, hit_rate, size, and maxsize."""
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            hit_rate=self.hit_rate,
+            size=len(self),
+            maxsize=self.maxsize,
+        )
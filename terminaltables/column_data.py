@@ -0,0 +1,171 @@
+"""Column-oriented table data (dict of columns, NumPy structured arrays), formatted lazily one cell at a time."""
+
+try:
+    from collections.abc import Sequence
+except ImportError:  # Python < 3.3.
+    from collections import Sequence
+
+from terminaltables import counters
+from terminaltables.table_data import cell_dimensions
+from terminaltables.width_and_alignment import is_ascii, RE_ASCII_CONTROL
+
+
+class ColumnData(Sequence):
+    """Rows of a table built on demand from columns, without converting them to a list of lists of strings first.
+
+    Use it as table_data for query results and other column-oriented sources. Each cell is formatted (with format() and
+    the column's format spec, or a callable) only when its row is read. Measuring the table goes column by column, so at
+    most one column of formatted cells is held in memory. Columns of printable ASCII are measured with a few bulk string
+    operations, and NumPy arrays of str with numpy_engine, instead of cell by cell.
+
+    Columns are read, not copied, so changes to them show up in the next render.
+    """
+
+    def __init__(self, columns, names=None, formats=None, heading=True):
+        """Constructor.
+
+        :param columns: Mapping of names to columns (e.g. a dict of lists), a NumPy structured array, or a sequence of
+            columns. Columns are sequences (lists, NumPy arrays, etc.) and may be shorter than others.
+        :param iter names: Column names. Defaults to the mapping's keys or the structured array's field names.
+        :param dict formats: Format specs (e.g. '.2f' or '>8,') or callables returning str, keyed on column name or
+            index. Other columns are formatted with str().
+        :param bool heading: Make the column names the first row.
+        """
+        field_names = getattr(getattr(columns, 'dtype', None), 'names', None)
+        if field_names:  # NumPy structured array.
+            keys = field_names
+            columns = [columns[k] for k in keys]
+        elif hasattr(columns, 'keys'):
+            keys = list(columns.keys())
+            columns = [columns[k] for k in keys]
+        else:
+            keys = None
+            columns = list(columns)
+
+        if names is None:
+            names = keys
+        self.columns = columns
+        self.names = None if names is None else [str(n) for n in names]
+        self.heading = bool(heading and self.names)
+        self._formatters = list()
+        for i, key in enumerate(keys or range(len(columns))):
+            spec = None if formats is None else formats.get(key, formats.get(i))
+            if spec is None:
+                self._formatters.append(str)
+            elif callable(spec):
+                self._formatters.append(spec)
+            else:
+                self._formatters.append(lambda value, spec=spec: format(value, spec))
+
+    def __getitem__(self, index):
+        """Return one row (list of formatted cells) or a list of rows.
+
+        :param index: Index or slice.
+
+        :return: Row or list of rows.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if self.heading and index == 0:
+            return list(self.names)
+        index -= 1 if self.heading else 0
+        if index < 0 or not self.columns:
+            raise IndexError('row index out of range')
+
+        try:
+            return [f(c[index]) for f, c in zip(self._formatters, self.columns)]
+        except IndexError:  # Past the end of shorter columns, or of every column.
+            if index >= len(self) - (1 if self.heading else 0):
+                raise
+            return [f(c[index]) if index < len(c) else '' for f, c in zip(self._formatters, self.columns)]
+
+    def __len__(self):
+        """Return the number of rows, including the heading."""
+        return max([len(c) for c in self.columns] or [0]) + (1 if self.heading else 0)
+
+    def __repr__(self):
+        """Represent with column names."""
+        return '{0}(names={1!r}, rows={2})'.format(self.__class__.__name__, self.names, len(self))
+
+    def dimensions(self):
+        """Measure the table one column at a time and return column widths, row heights, and if the table is plain.
+
+        :return: Same 4-item tuple as measure_table() (the list of measured cells is always None).
+        :rtype: tuple
+        """
+        if not len(self):
+            return [], [], True, None
+        heights, widths, plain = [0] * (len(self) - (1 if self.heading else 0)), list(), True
+        one_line = 0  # Rows before this index are at least one line high.
+        active = counters.ACTIVE
+        if active is not None:
+            active.measure_table_calls += 1
+
+        for i in range(len(self.columns)):
+            width, column_heights, column_plain = self._measure_column(i)
+            widths.append(width)
+            plain = plain and column_plain
+            if column_heights is None:
+                one_line = max(one_line, len(self.columns[i]))
+            else:
+                heights[:len(column_heights)] = [max(a, b) for a, b in zip(heights, column_heights)]
+        if one_line:
+            heights[:one_line] = [h or 1 for h in heights[:one_line]]
+
+        if self.heading:
+            heading_heights = list()
+            for i, name in enumerate(self.names):
+                width, height, name_plain = cell_dimensions(name)
+                if i < len(widths):
+                    widths[i] = max(widths[i], width)
+                else:
+                    widths.append(width)
+                heading_heights.append(height)
+                plain = plain and name_plain
+            heights.insert(0, max(heading_heights or [0]))
+        return widths, heights, plain, None
+
+    def format_column(self, index):
+        """Return the formatted cells of one column (without the heading), a NumPy array if the column already is str.
+
+        :param int index: Column index.
+
+        :return: List of str or NumPy array of str.
+        """
+        column, formatter = self.columns[index], self._formatters[index]
+        if formatter is str and getattr(getattr(column, 'dtype', None), 'kind', None) == 'U':
+            return column
+        return [formatter(v) for v in column]
+
+    def _measure_column(self, index):
+        """Measure one column like measure_table() would.
+
+        :param int index: Column index.
+
+        :return: 3-item tuple: widest cell, list of cell heights (None if all are one line high), and if all are plain.
+        :rtype: tuple
+        """
+        cells = self.format_column(index)
+        if hasattr(cells, 'dtype'):  # Unformatted NumPy array of str, NumPy is already imported.
+            from terminaltables import numpy_engine
+            widths, heights, plain = numpy_engine.measure_columns([cells])[:3]
+            return (widths[0] if widths else 0), heights, plain
+
+        # Whole column of printable ASCII: widths are lengths, no need to look at cells one by one.
+        joined = ''.join(cells)
+        if '\033' not in joined and is_ascii(joined) and not RE_ASCII_CONTROL.search(joined):
+            active = counters.ACTIVE
+            if active is not None:
+                active.chars_scanned += len(joined)
+            heights = None if all(cells) else [1 if c else 0 for c in cells]
+            return max(map(len, cells)) if cells else 0, heights, True
+
+        width, heights, plain = 0, list(), True
+        for cell in cells:
+            cell_width, height, cell_plain = cell_dimensions(cell)
+            width = max(width, cell_width)
+            heights.append(height)
+            plain = plain and cell_plain
+        return width, heights, plain
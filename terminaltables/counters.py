@@ -0,0 +1,62 @@
+"""Opt-in counters of the work done while measuring and rendering tables.
+
+Meant for tests asserting that rendering N rows does O(N) work (no accidental re-measuring or quadratic loops):
+
+    counters = enable_counters()
+    table.table
+    assert counters.measure_table_calls == 1
+    disable_counters()
+"""
+
+ACTIVE = None  # OperationCounters instance being incremented, None when counting is disabled.
+
+
+class OperationCounters(object):
+    """Number of times each expensive operation ran since counting was enabled (or reset).
+
+    Increments aren't locked, so counts are only approximate while several threads render tables.
+    """
+
+    FIELDS = (
+        'build_border_calls',  # build.build_border() invocations (cached borders don't count).
+        'chars_scanned',  # Characters inspected to measure widths, by measure_table() and visible_width().
+        'measure_table_calls',  # Passes over the whole table to measure it (max_dimensions() included).
+        'padding_allocations',  # Padded strings built by align_and_pad_cell() and RowTemplate.format_plain().
+        'splitlines_calls',  # Cells split into lines.
+        'visible_width_calls',  # visible_width() invocations.
+    )
+
+    def __init__(self):
+        """Constructor."""
+        self.build_border_calls = 0
+        self.chars_scanned = 0
+        self.measure_table_calls = 0
+        self.padding_allocations = 0
+        self.splitlines_calls = 0
+        self.visible_width_calls = 0
+
+    def reset(self):
+        """Set every counter back to 0."""
+        self.__init__()
+
+    @property
+    def stats(self):
+        """Return a dictionary of every counter."""
+        return dict((f, getattr(self, f)) for f in self.FIELDS)
+
+
+def enable_counters():
+    """Start counting operations of every table in every thread. Calling this again starts over with new counters.
+
+    :return: The counters being incremented.
+    :rtype: OperationCounters
+    """
+    global ACTIVE  # pylint: disable=global-statement
+    ACTIVE = OperationCounters()
+    return ACTIVE
+
+
+def disable_counters():
+    """Stop counting operations. Counters returned by enable_counters() keep their values."""
+    global ACTIVE  # pylint: disable=global-statement
+    ACTIVE = None
@@ -0,0 +1,65 @@
+"""Measured dimensions of a table, computed in a single pass over the table data."""
+
+from terminaltables.width_and_alignment import measure_table
+
+
+class Layout(object):
+    """Column widths, row heights, and total width of a table.
+
+    Everything is derived from one measure_table() call so rendering and the width/ok queries don't re-scan the table.
+    """
+
+    def __init__(self, inner_widths, inner_heights, padding, outer_border, inner_border):
+        """Constructor.
+
+        :param list inner_widths: Width of each column without padding.
+        :param list inner_heights: Height (number of lines) of each row without padding. None if not measured.
+        :param int padding: Total padding per cell (left + right padding).
+        :param int outer_border: Sum of left and right outer border visible widths.
+        :param int inner_border: Visible width of the inner border character.
+        """
+        self.inner_widths = inner_widths
+        self.inner_heights = inner_heights
+        self.padding = padding
+        self.outer_border = outer_border
+        self.inner_border = inner_border
+        self.outer_widths = [padding + w for w in inner_widths]
+        self.plain = False  # True if every cell is single-line ASCII without control characters (see measure_table()).
+        self.cells = None  # Rows of measure_cell() results, if kept.
+
+        # Count how much space outer and inner borders take up.
+        non_data_space = outer_border
+        if inner_widths:
+            non_data_space += inner_border * (len(inner_widths) - 1)
+        self.table_width = sum(self.outer_widths) + non_data_space
+
+    @classmethod
+    def measure(cls, table_data, padding, outer_border, inner_border, keep_cells=False):
+        """Measure table data and return a new Layout instance.
+
+        :param iter table_data: List of list of strings (unmodified table data).
+        :param int padding: Total padding per cell (left + right padding).
+        :param int outer_border: Sum of left and right outer border visible widths.
+        :param int inner_border: Visible width of the inner border character.
+        :param bool keep_cells: Keep each cell's split lines and their widths in `cells` for rendering.
+
+        :return: Layout of the table.
+        :rtype: Layout
+        """
+        inner_widths, inner_heights, plain, cells = measure_table(table_data, keep_cells)
+        layout = cls(inner_widths, inner_heights, padding, outer_border, inner_border)
+        layout.plain, layout.cells = plain, cells
+        return layout
+
+    def column_max_width(self, column_number, terminal_width):
+        """Determine the maximum width of a column that fits within the terminal without causing line wrapping.
+
+        :param int column_number: The column number to query.
+        :param int terminal_width: Width of the terminal.
+
+        :return: The maximum width the column can be without causing line wrapping.
+        :rtype: int
+        """
+        data_space = sum(self.inner_widths) - self.inner_widths[column_number]
+        non_data_space = self.table_width - sum(self.inner_widths)
+        return terminal_width - data_space - non_data_space
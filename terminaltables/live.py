@@ -0,0 +1,186 @@
+"""Redraw a table in place in the terminal, rewriting only the lines that changed since the last refresh."""
+
+import sys
+
+CURSOR_DOWN = '\033[{0}B'
+CURSOR_UP = '\033[{0}A'
+ERASE_BELOW = '\033[J'
+ERASE_LINE_END = '\033[K'
+
+
+def changed_lines(old, new):
+    """Return the indexes of lines in `new` that are different from (or not in) `old`.
+
+    :param list old: Previously written lines.
+    :param list new: Lines to write.
+
+    :return: Sorted line indexes.
+    :rtype: list
+    """
+    common = min(len(old), len(new))
+    return [i for i in range(common) if old[i] != new[i]] + list(range(common, len(new)))
+
+
+def move_cursor(lines):
+    """Return the escape sequence that moves the cursor down (or up if negative) some lines.
+
+    :param int lines: Number of lines to move down.
+
+    :return: Escape sequence (empty if lines is 0).
+    :rtype: str
+    """
+    if lines > 0:
+        return CURSOR_DOWN.format(lines)
+    if lines < 0:
+        return CURSOR_UP.format(-lines)
+    return ''
+
+
+def update_terminal(old, new):
+    """Return what to write to a terminal showing `old` lines (cursor on the line below them) to show `new` instead.
+
+    Only changed lines are rewritten, using cursor movement escape sequences. The cursor ends up at the start of the
+    line below the new lines. Lines must fit within the terminal's width and height, or the cursor movements go wrong.
+
+    :param list old: Lines currently on the terminal, above the cursor.
+    :param list new: Lines to show.
+
+    :return: Output for the terminal (empty if nothing changed).
+    :rtype: str
+    """
+    output = list()
+    position = len(old)  # Line the cursor is on, relative to the first line of old.
+    for i in changed_lines(old, new):
+        if i >= len(old):
+            break
+        output.append(move_cursor(i - position) + '\r' + new[i] + ERASE_LINE_END)
+        position = i
+
+    # Go back to the line below old (or below new if it's shorter).
+    end = min(len(old), len(new))
+    if output or position != end:
+        output.append(move_cursor(end - position) + '\r')
+
+    # Append new lines, or erase leftover old ones.
+    if len(new) > len(old):
+        output.append(''.join(line + '\n' for line in new[len(old):]))
+    elif len(new) < len(old):
+        output.append('\r' + ERASE_BELOW)
+    return ''.join(output)
+
+
+class LiveTable(object):
+    """Keep a table up to date on the terminal.
+
+    Each refresh() renders the table and rewrites only the lines that changed. With a table_data.TableData as
+    table_data, rows that didn't change since the last refresh (and whose column widths and row heights stayed the
+    same) are not even rendered again. Anything else (rows added or removed, columns resized, plain lists) renders the
+    whole table, and only changed lines are still written.
+
+    Nothing else should be written to the stream between refreshes.
+    """
+
+    def __init__(self, table, stream=None):
+        """Constructor.
+
+        :param terminaltables.base_table.BaseTable table: Table to display.
+        :param stream: File-like object connected to a terminal. Defaults to sys.stdout.
+        """
+        self.table = table
+        self.stream = stream
+        self.lines = list()  # Lines currently shown.
+        self.rendered_rows = 0  # Rows rendered by the last refresh().
+        self._rendered = list()  # Lines of the last render().
+        self._key = None  # Everything besides row contents the previous render depends on.
+        self._table_data = None  # Keeps the previous table_data alive so its id() in _key isn't reused.
+        self._starts = None  # Line index of the first line of each row in `lines`, None if unknown.
+
+    def _render_key(self, layout):
+        """Return everything besides rows that the lines of a render depend on.
+
+        :param terminaltables.layout.Layout layout: Layout being rendered.
+
+        :return: Comparable key.
+        :rtype: tuple
+        """
+        table = self.table
+        characters = tuple(getattr(table, n) for n in sorted(dir(table)) if n.startswith('CHAR_'))
+        settings = tuple(getattr(table, n, None) for n in (
+            'title', 'inner_column_border', 'inner_footing_row_border', 'inner_heading_row_border', 'inner_row_border',
+            'outer_border', 'padding_left', 'padding_right',
+        ))
+        justify = tuple(sorted(table.justify_columns.items()))
+        widths, heights = layout.inner_widths, layout.inner_heights
+        return id(table.table_data), type(table), characters, settings, justify, widths, heights
+
+    def _row_starts(self, heights, line_count):
+        """Find the first line of each row in a render, from row heights and border settings (see iter_lines()).
+
+        :param list heights: Inner height of each row.
+        :param int line_count: Number of lines rendered.
+
+        :return: Line index of each row, or None if the table's lines aren't laid out like BaseTable's.
+        :rtype: list
+        """
+        table = self.table
+        starts, line = list(), 1 if table.outer_border else 0
+        for i, height in enumerate(heights):
+            starts.append(line)
+            line += max(height, 1)
+            if i == len(heights) - 1:
+                break
+            if table.inner_row_border or (table.inner_heading_row_border and i == 0):
+                line += 1
+            if i == len(heights) - 2 and table.inner_footing_row_border:
+                line += 1
+        line += 1 if table.outer_border else 0
+        return starts if line == line_count else None
+
+    def render(self):
+        """Render the table, reusing lines of unchanged rows from the last render if possible.
+
+        :return: Lines of the table.
+        :rtype: list
+        """
+        table = self.table
+        table_data = table.table_data
+        layout = table.measure()
+        key = self._render_key(layout)
+        is_dirty = getattr(table_data, 'is_dirty', None)
+
+        if is_dirty is None or key != self._key or self._starts is None:
+            lines = list(table.iter_lines(layout=layout))
+            self.rendered_rows = len(layout.inner_heights or ())
+            self._starts = self._row_starts(layout.inner_heights or (), len(lines))
+        else:
+            lines = list(self._rendered)
+            self.rendered_rows = 0
+            for i, start in enumerate(self._starts):
+                if not is_dirty(i):
+                    continue
+                row_lines = list(table.iter_lines(i, i + 1, layout))
+                if table.outer_border:
+                    row_lines = row_lines[1:-1]
+                lines[start:start + len(row_lines)] = row_lines
+                self.rendered_rows += 1
+
+        self._rendered, self._key, self._table_data = lines, key, table_data
+        if is_dirty is not None:
+            table_data.clean()
+        return lines
+
+    def refresh(self):
+        """Render the table and update the terminal.
+
+        :return: Number of lines written.
+        :rtype: int
+        """
+        lines = self.render()
+        output = update_terminal(self.lines, lines)
+        stream = self.stream or sys.stdout
+        if output:
+            stream.write(output)
+            stream.flush()
+        written = len(changed_lines(self.lines, lines))
+        self.lines = lines
+        return written
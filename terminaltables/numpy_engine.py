@@ -0,0 +1,158 @@
+"""Measure large tables with NumPy, vectorized over whole columns instead of looping over cells. Requires NumPy.
+
+Cells that are printable ASCII (no control characters or escape sequences) are as wide as they are long, so their
+widths come from numpy.char.str_len() in bulk. Only the remaining cells (non-ASCII, colored, multi-line, etc.) are
+measured one by one, exactly like measure_table() does, so results are identical to the pure Python path. NumPy drops
+trailing NUL characters from strings it stores, so cells ending with one are measured one by one too (except in columns
+that already are NumPy arrays of str, which lost them before they got here).
+
+NumPy stores every string of an array in as much memory as the longest one, so columns are converted and classified in
+chunks of about CHUNK_BYTES, and cells longer than MAX_CELL_CHARS are kept out of the arrays and measured one by one.
+"""
+
+import numpy
+
+from terminaltables import counters
+from terminaltables.table_data import cell_dimensions
+
+CHUNK_BYTES = 1 << 22  # Size of the cells classified at once, bounds the size of temporary arrays.
+MAX_CELL_CHARS = 256  # Longer cells are measured one by one instead of widening every cell of their chunk.
+
+
+def as_column(column):
+    """Return a column as a one-dimensional NumPy array of str.
+
+    :param iter column: NumPy array or sequence of cells.
+
+    :return: Array with a unicode dtype.
+    :rtype: numpy.ndarray
+    """
+    array = numpy.asarray(column)
+    if array.dtype.kind != 'U':
+        array = numpy.asarray(column, dtype=str)
+    return numpy.ascontiguousarray(array.reshape(-1))  # Contiguous to view characters as code points.
+
+
+def _gen_chunks(column):
+    """Split a column into contiguous arrays of str of about CHUNK_BYTES each.
+
+    Arrays of str are sliced as they are. Other columns are converted a chunk at a time, with cells longer than
+    MAX_CELL_CHARS or ending with a NUL (which NumPy would drop) replaced by empty strings and returned separately.
+
+    :param iter column: NumPy array or sequence of cells.
+
+    :return: Yields 3-item tuples: index of the chunk's first cell, array, and dict of cells to measure one by one
+        keyed on their index in the chunk.
+    """
+    if getattr(column, 'dtype', None) is not None and column.dtype.kind == 'U':
+        column = column.reshape(-1)
+        size = max(CHUNK_BYTES // max(column.dtype.itemsize, 1), 1)
+        for start in range(0, len(column), size):
+            yield start, numpy.ascontiguousarray(column[start:start + size]), dict()
+        return
+
+    size = max(CHUNK_BYTES // (4 * MAX_CELL_CHARS), 1)
+    if getattr(column, 'dtype', None) is not None and column.dtype.kind != 'O':  # Numbers, etc. are short as str.
+        column = column.reshape(-1)
+        for start in range(0, len(column), size):
+            yield start, as_column(column[start:start + size]), dict()
+        return
+
+    for start in range(0, len(column), size):
+        cells = list(column[start:start + size])
+        held_out = dict()
+        if cells and max(map(len, cells)) > MAX_CELL_CHARS:
+            held_out = dict((i, c) for i, c in enumerate(cells) if len(c) > MAX_CELL_CHARS)
+            for i in held_out:
+                cells[i] = ''
+        if '\0' in ''.join(cells):  # NumPy would drop trailing NULs.
+            for i, cell in enumerate(cells):
+                if cell.endswith('\0'):
+                    held_out[i], cells[i] = cell, ''
+        yield start, as_column(cells), held_out
+
+
+def _special(array, lengths):
+    """Find cells that aren't printable ASCII and have to be measured one by one.
+
+    Trailing NULs in fixed width unicode arrays are padding. A cell is special if any of its characters is outside of
+    the printable ASCII range, which is the case when there are more such characters than padding.
+
+    :param numpy.ndarray array: Contiguous unicode array of cells (one chunk, see _gen_chunks()).
+    :param numpy.ndarray lengths: numpy.char.str_len() of array.
+
+    :return: Boolean array, True for special cells.
+    :rtype: numpy.ndarray
+    """
+    size = array.dtype.itemsize // 4
+    if not size or not len(array):
+        return numpy.zeros(array.shape, dtype=bool)
+    codes = array.view(numpy.uint32).reshape(array.shape + (size,))
+    outside = ((codes - 32) >= 95).sum(axis=-1)  # Wraps around below 32, so NULs and control characters count.
+    return outside > size - lengths
+
+
+def measure_columns(columns):
+    """Get maximum widths of each column and maximum height of each row, same as measure_table() on the equivalent rows.
+
+    Columns shorter than others are padded with empty cells.
+
+    :param iter columns: NumPy arrays or sequences of str, one per column.
+
+    :return: Same 4-item tuple as measure_table() (the list of measured cells is always None).
+    :rtype: tuple
+    """
+    columns = list(columns)
+    row_count = max([len(c) for c in columns] or [0])
+    heights = numpy.zeros(row_count, dtype=numpy.intp)
+    widths, plain = list(), True
+    active = counters.ACTIVE
+    if active is not None:
+        active.measure_table_calls += 1
+
+    for column in columns:
+        width = 0
+        for start, array, held_out in _gen_chunks(column):
+            lengths = numpy.char.str_len(array) if len(array) else numpy.zeros(0, dtype=numpy.intp)
+            special = _special(array, lengths)
+            cell_heights = (lengths > 0).astype(numpy.intp)
+            if active is not None:
+                active.chars_scanned += int(lengths[~special].sum())
+
+            # Measure everything else the same way measure_table() does.
+            indexes = numpy.flatnonzero(special)
+            if len(indexes) or held_out:
+                lengths = lengths.astype(numpy.intp)
+                for index in indexes.tolist():
+                    lengths[index], cell_heights[index] = cell_dimensions(array[index])[:2]
+                plain = plain and not len(indexes)
+                for index, cell in held_out.items():
+                    lengths[index], cell_heights[index], cell_plain = cell_dimensions(cell)
+                    plain = plain and cell_plain
+
+            if len(lengths):
+                width = max(width, int(lengths.max()))
+            chunk_heights = heights[start:start + len(array)]
+            numpy.maximum(chunk_heights, cell_heights, out=chunk_heights)
+        widths.append(width)
+
+    return widths, heights.tolist(), plain, None
+
+
+def measure_table(table_data):
+    """Get maximum widths of each column and maximum height of each row of a list of rows.
+
+    Rows are split into columns first (rows shorter than others are padded with empty cells).
+
+    :param iter table_data: List of list of strings (unmodified table data).
+
+    :return: Same 4-item tuple as width_and_alignment.measure_table() (the list of measured cells is always None).
+    :rtype: tuple
+    """
+    rows = list(table_data)
+    column_count = max([len(r) for r in rows] or [0])
+    if not column_count:
+        return [], [0] * len(rows), True, None
+    if any(len(r) != column_count for r in rows):
+        rows = [list(r) + [''] * (column_count - len(r)) for r in rows]
+    return measure_columns(zip(*rows))
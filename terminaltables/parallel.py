@@ -0,0 +1,183 @@
+"""Render very large tables on several CPU cores with a process pool. Output is identical to the `table` property."""
+
+import multiprocessing
+
+from terminaltables.base_table import BaseTable
+from terminaltables.layout import Layout
+from terminaltables.width_and_alignment import measure_table
+
+MIN_ROWS = 20000  # Smaller tables render faster than a pool starts.
+
+_WORKER = None  # Table rebuilt in each worker process by _init_worker().
+
+
+class _Window(object):
+    """Read-only sequence of a few values at an offset of a longer sequence, zeros elsewhere.
+
+    Workers get row heights for the rows they render (and the next two, which iter_lines() looks ahead to) instead of
+    the heights of the whole table.
+    """
+
+    def __init__(self, values, offset, length):
+        """Constructor.
+
+        :param list values: Values from offset on.
+        :param int offset: Index of the first value.
+        :param int length: Length of the whole sequence.
+        """
+        self.values = values
+        self.offset = offset
+        self.length = length
+
+    def __getitem__(self, index):
+        """Return a value, or 0 if it's outside of the window.
+
+        :param int index: Index in the whole sequence.
+
+        :return: Value.
+        """
+        if self.offset <= index < self.offset + len(self.values):
+            return self.values[index - self.offset]
+        return 0
+
+    def __len__(self):
+        """Return the length of the whole sequence."""
+        return self.length
+
+
+def _init_worker(cls, settings, table_data):
+    """Rebuild the table in a worker process. Runs once per worker, so table_data isn't sent along with every task.
+
+    :param cls: Table class.
+    :param dict settings: Public instance attributes of the table (except table_data).
+    :param iter table_data: Rows of the table.
+    """
+    global _WORKER  # pylint: disable=global-statement
+    table = cls.__new__(cls)
+    BaseTable.__init__(table, table_data)
+    vars(table).update(settings)
+    _WORKER = table
+
+
+def _measure_chunk(bounds):
+    """Measure some rows of the table.
+
+    :param tuple bounds: Index of the first row and index after the last row.
+
+    :return: Column widths, row heights, and if the rows are plain (see measure_table()).
+    :rtype: tuple
+    """
+    start, stop = bounds
+    return measure_table(_WORKER.table_data[start:stop])[:3]
+
+
+def _render_chunk(task):
+    """Render some rows of the table, with the lines between them and the rows before (but no outer borders).
+
+    The row before the chunk is rendered too, so every separator above the chunk's first row comes from iter_lines()
+    itself, then dropped along with the top border.
+
+    :param tuple task: Index of the first and after the last row, column widths, heights window, and if plain.
+
+    :return: Lines joined with newlines.
+    :rtype: str
+    """
+    start, stop, widths, heights, plain = task
+    table = _WORKER
+    layout = _layout(table, widths, heights, plain)
+    border_lines = len(list(table.iter_lines(0, 0, layout))) // 2  # Top and bottom borders, if any.
+    first = max(start - 1, 0)
+    lines = list(table.iter_lines(first, stop, layout))
+    if start:
+        lines = lines[len(list(table.iter_lines(first, start, layout))) - border_lines:]
+    else:
+        lines = lines[border_lines:]
+    return '\n'.join(lines[:len(lines) - border_lines])
+
+
+def _layout(table, widths, heights, plain):
+    """Return a Layout from measurements reduced from every chunk.
+
+    :param BaseTable table: Table being rendered.
+    :param list widths: Inner column widths.
+    :param heights: Inner row heights (list or _Window).
+    :param bool plain: Every cell is plain (see measure_table()).
+
+    :return: Layout of the whole table.
+    :rtype: Layout
+    """
+    layout = Layout(
+        widths,
+        heights,
+        table.padding_left + table.padding_right,
+        2 if table.outer_border else 0,
+        1 if table.inner_column_border else 0,
+    )
+    layout.plain = plain
+    return layout
+
+
+def render_parallel(table, processes=None, chunk_rows=None, min_rows=MIN_ROWS):
+    """Render a table with a pool of processes. Same output as table.table.
+
+    First chunks of rows are measured in parallel and the partial column widths and row heights combined, then chunks
+    of rows are rendered in parallel with the final widths and concatenated in order.
+
+    Tables with fewer than min_rows rows, tables on a single CPU, and tables that can't be split into chunks (table_data
+    isn't a sequence, or fixed_column_widths or sample_rows is set) are rendered in this process instead. The profiler
+    and row_cache attributes aren't used in worker processes. With start methods other than fork (e.g. on Windows)
+    table_data and the table's class and attributes must be picklable.
+
+    :param BaseTable table: Table to render.
+    :param int processes: Number of worker processes. Defaults to the number of CPUs.
+    :param int chunk_rows: Rows per task. Defaults to about four tasks per process.
+    :param int min_rows: Render tables with fewer rows without a pool.
+
+    :return: Printable table.
+    :rtype: str
+    """
+    processes = processes or multiprocessing.cpu_count()
+    table_data = table.table_data
+    try:
+        row_count = len(table_data)
+    except TypeError:  # Not a sequence (e.g. a generator).
+        row_count = 0
+    measured = table.fixed_column_widths is None and table.sample_rows is None  # Otherwise row heights are unknown.
+    if processes < 2 or row_count < max(min_rows, 2) or not measured:
+        return table.table
+
+    chunk_rows = chunk_rows or -(-row_count // (processes * 4))
+    bounds = [(i, min(i + chunk_rows, row_count)) for i in range(0, row_count, chunk_rows)]
+    settings = dict((k, v) for k, v in vars(table).items() if not k.startswith('_') and k not in (
+        'profiler', 'row_cache', 'table_data',
+    ))
+    pool = multiprocessing.Pool(processes, _init_worker, (type(table), settings, table_data))
+    try:
+        # Measure. Tables keeping their own dimensions (e.g. TableData) don't need it.
+        if hasattr(table_data, 'dimensions'):
+            widths, heights, plain = table_data.dimensions()[:3]
+        else:
+            widths, heights, plain = list(), list(), True
+            for chunk_widths, chunk_heights, chunk_plain in pool.map(_measure_chunk, bounds):
+                widths.extend([0] * (len(chunk_widths) - len(widths)))  # Chunk with longer rows.
+                for i, width in enumerate(chunk_widths):
+                    if width > widths[i]:
+                        widths[i] = width
+                heights.extend(chunk_heights)
+                plain = plain and chunk_plain
+
+        # Render.
+        tasks = list()
+        for start, stop in bounds:
+            first = max(start - 1, 0)
+            tasks.append((start, stop, widths, _Window(heights[first:stop + 2], first, row_count), plain))
+        chunks = pool.map(_render_chunk, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+    # Borders are the same as when rendering in one process, so they come from this process' border cache.
+    layout = _layout(table, widths, heights, plain)
+    top_bottom = list(table.iter_lines(0, 0, layout))
+    top, bottom = top_bottom[:len(top_bottom) // 2], top_bottom[len(top_bottom) // 2:]
+    return '\n'.join(top + chunks + bottom)
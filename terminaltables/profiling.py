@@ -0,0 +1,82 @@
+"""Optional per-phase timing of table rendering."""
+
+from timeit import default_timer
+
+PHASES = ('max_dimensions', 'gen_cell_lines', 'build_border', 'join', 'escape_merge')
+
+
+class Profiler(object):
+    """Collect wall time and call counts for each phase of rendering a table.
+
+    Assign an instance to a table's `profiler` attribute and render it. Phases are:
+
+    max_dimensions -- measuring table_data (column widths and row heights).
+    gen_cell_lines -- aligning and padding the cells of one row and adding borders.
+    build_border -- building (or fetching from cache) the top, bottom, or a separator border.
+    join -- joining the pieces of one line, and joining all lines into the table string.
+    escape_merge -- merging adjacent box-drawing escape sequences in one line (UnixTable without padding only).
+
+    Tables without a profiler don't pay for any of this.
+    """
+
+    def __init__(self, callback=None):
+        """Constructor.
+
+        :param callback: Optional function called with the phase name and elapsed seconds after each timed call.
+        """
+        self.callback = callback
+        self.calls = dict()
+        self.seconds = dict()
+
+    def __str__(self):
+        """Return a report with one line per phase, slowest first."""
+        lines = ['{0:<16} {1:>10} {2:>12}'.format('phase', 'calls', 'seconds')]
+        for phase, (calls, seconds) in sorted(self.stats.items(), key=lambda i: -i[1][1]):
+            lines.append('{0:<16} {1:>10} {2:>12.6f}'.format(phase, calls, seconds))
+        return '\n'.join(lines)
+
+    def record(self, phase, seconds):
+        """Add one call of a phase.
+
+        :param str phase: Name of the phase.
+        :param float seconds: Elapsed wall time.
+        """
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        if self.callback:
+            self.callback(phase, seconds)
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        self.calls.clear()
+        self.seconds.clear()
+
+    def wrap(self, phase, func):
+        """Return a function that calls `func` and records its elapsed time under `phase`.
+
+        :param str phase: Name of the phase.
+        :param func: Function to time.
+
+        :return: Timed function with the same signature and return value.
+        """
+        record = self.record
+
+        def timed(*args, **kwargs):
+            """Call and time the wrapped function.
+
+            :param args: Passed to the wrapped function.
+            :param kwargs: Passed to the wrapped function.
+
+            :return: Return value of the wrapped function.
+            """
+            start = default_timer()
+            result = func(*args, **kwargs)
+            record(phase, default_timer() - start)
+            return result
+
+        return timed
+
+    @property
+    def stats(self):
+        """Return a dictionary of phase names mapped to (calls, seconds) tuples."""
+        return dict((p, (c, self.seconds[p])) for p, c in self.calls.items())
@@ -0,0 +1,243 @@
+"""List of rows that keeps column widths and row heights up to date and tracks what changed."""
+
+try:
+    from collections.abc import MutableSequence
+except ImportError:  # Python < 3.3.
+    from collections import MutableSequence
+
+from terminaltables import counters
+from terminaltables.width_and_alignment import is_ascii, measure_cell, RE_ASCII_CONTROL
+
+
+def cell_dimensions(cell):
+    """Measure one cell the way measure_table() does.
+
+    :param str cell: Cell contents.
+
+    :return: 3-item tuple: visible width (of the widest line), height (0 if empty), and if the cell is plain.
+    :rtype: tuple
+    """
+    if not cell:
+        return 0, 0, True
+    if '\033' not in cell and is_ascii(cell):
+        active = counters.ACTIVE
+        if active is not None:
+            active.chars_scanned += len(cell)
+        if not RE_ASCII_CONTROL.search(cell):
+            return len(cell), 1, True
+        if active is not None:
+            active.splitlines_calls += 1
+        return max([len(line) for line in cell.splitlines()] or [0]), cell.count('\n') + 1, False
+    return max(measure_cell(cell)[1]), cell.count('\n') + 1, False
+
+
+class TableData(MutableSequence):
+    """Rows of a table (lists of strings) that update the table's dimensions on every change, instead of a full rescan.
+
+    Use it as table_data for tables that change a little between renders (e.g. appending rows every second). Appending,
+    inserting, replacing, or deleting rows costs time proportional to the number of cells changed. Each column keeps a
+    histogram of cell widths so removing its widest cell doesn't require measuring the others again.
+
+    Every change bumps `version` (tables reuse their layout while it's unchanged) and is recorded until clean() is
+    called, for callers that re-render only what changed: `dirty_rows` holds indexes of rows replaced in place,
+    `shifted_from` is the first index of rows that moved (inserts and deletes, None if nothing moved), and
+    `dirty_columns` holds indexes of columns with cells added, removed, or changed.
+
+    Rows are copied in. Don't modify them in place: replace the row (table_data[i] = row) or call set_cell().
+    """
+
+    def __init__(self, rows=()):
+        """Constructor.
+
+        :param iter rows: Initial rows.
+        """
+        self._rows = list()
+        self._heights = list()  # Height of each row.
+        self._histograms = list()  # Per column: dict of cell widths mapped to number of cells that wide.
+        self._widths = list()  # Per column: widest cell.
+        self._lengths = dict()  # Number of cells in a row mapped to number of rows that long.
+        self._not_plain = 0  # Number of cells that aren't plain (see measure_table()).
+        self.version = 0
+        self.dirty_columns = set()
+        self.dirty_rows = set()
+        self.shifted_from = None
+        self.extend(rows)
+
+    def __delitem__(self, index):
+        """Delete one row or a slice of rows.
+
+        :param index: Index or slice.
+        """
+        if isinstance(index, slice):
+            removed = self._rows[index]
+            start, _, step = index.indices(len(self._rows))
+            first = min(start, start + (len(removed) - 1) * step) if removed else None  # Lowest index deleted.
+        else:
+            removed, first = [self._rows[index]], index % len(self._rows)
+        del self._rows[index]
+        del self._heights[index]
+        for row in removed:
+            self._forget(row)
+        if first is not None:
+            self._touch(first, shifted=True, columns=max([len(r) for r in removed] or [0]))
+
+    def __getitem__(self, index):
+        """Return one row or a list of rows.
+
+        :param index: Index or slice.
+
+        :return: Row (don't modify it in place) or list of rows.
+        """
+        return self._rows[index]
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self._rows)
+
+    def __repr__(self):
+        """Represent like a list."""
+        return '{0}({1!r})'.format(self.__class__.__name__, self._rows)
+
+    def __setitem__(self, index, value):
+        """Replace one row or a slice of rows.
+
+        :param index: Index or slice.
+        :param value: Row, or iterable of rows for slices.
+        """
+        if isinstance(index, slice):
+            rows = [list(r) for r in value]
+            removed = self._rows[index]
+            self._rows[index] = rows  # Raises before anything changes if an extended slice doesn't fit.
+            self._heights[index] = [self._learn(r) for r in rows]
+            for row in removed:
+                self._forget(row)
+            start, _, step = index.indices(len(self._rows) - len(rows) + len(removed))
+            if len(rows) != len(removed):
+                self._touch(start, shifted=True, columns=max([len(r) for r in removed + rows] or [0]))
+            else:
+                for i, (old, new) in enumerate(zip(removed, rows)):
+                    self._touch(start + i * step, old=old, new=new)
+            return
+
+        row = list(value)
+        removed = self._rows[index]
+        index %= len(self._rows)
+        self._rows[index] = row
+        self._heights[index] = self._learn(row)
+        self._forget(removed)
+        self._touch(index, old=removed, new=row)
+
+    def _forget(self, row):
+        """Remove a row's cells from the histograms.
+
+        :param list row: Row that was removed or replaced.
+        """
+        length = len(row)
+        self._lengths[length] -= 1
+        if not self._lengths[length]:
+            del self._lengths[length]
+
+        for i, cell in enumerate(row):
+            width, _, plain = cell_dimensions(cell)
+            if not plain:
+                self._not_plain -= 1
+            histogram = self._histograms[i]
+            histogram[width] -= 1
+            if not histogram[width]:
+                del histogram[width]
+                if width == self._widths[i]:
+                    self._widths[i] = max(histogram) if histogram else 0
+
+    def _touch(self, index, shifted=False, columns=0, old=(), new=()):
+        """Record a change and bump the version.
+
+        :param int index: Row changed in place, or first row that moved.
+        :param bool shifted: Rows from index on moved.
+        :param int columns: Mark columns 0 to this (excluded) dirty.
+        :param list old: Replaced row, cells different from `new` mark their columns dirty.
+        :param list new: Replacement row.
+        """
+        self.version += 1
+        if shifted:
+            self.shifted_from = index if self.shifted_from is None else min(self.shifted_from, index)
+        else:
+            self.dirty_rows.add(index)
+        self.dirty_columns.update(range(columns))
+        if old or new:
+            padded = max(len(old), len(new))
+            old, new = list(old) + [''] * (padded - len(old)), list(new) + [''] * (padded - len(new))
+            self.dirty_columns.update(i for i, (a, b) in enumerate(zip(old, new)) if a != b)
+
+    def _learn(self, row):
+        """Add a row's cells to the histograms.
+
+        :param list row: Row that was added.
+
+        :return: Height of the row.
+        :rtype: int
+        """
+        self._lengths[len(row)] = self._lengths.get(len(row), 0) + 1
+        while len(self._histograms) < len(row):
+            self._histograms.append(dict())
+            self._widths.append(0)
+
+        height = 0
+        for i, cell in enumerate(row):
+            width, cell_height, plain = cell_dimensions(cell)
+            histogram = self._histograms[i]
+            histogram[width] = histogram.get(width, 0) + 1
+            if width > self._widths[i]:
+                self._widths[i] = width
+            if cell_height > height:
+                height = cell_height
+            if not plain:
+                self._not_plain += 1
+        return height
+
+    def clean(self):
+        """Forget recorded changes (not the version). Call after re-rendering what changed."""
+        self.dirty_columns.clear()
+        self.dirty_rows.clear()
+        self.shifted_from = None
+
+    def dimensions(self):
+        """Return column widths, row heights, and if the table is plain, without measuring any cell.
+
+        :return: Same 4-item tuple as measure_table() (the list of measured cells is always None).
+        :rtype: tuple
+        """
+        columns = max(self._lengths) if self._lengths else 0
+        return self._widths[:columns], list(self._heights), not self._not_plain, None
+
+    def insert(self, index, value):
+        """Insert a row before index.
+
+        :param int index: Position of the new row.
+        :param iter value: New row.
+        """
+        row = list(value)
+        index = min(max(index + len(self._rows) if index < 0 else index, 0), len(self._rows))
+        self._rows.insert(index, row)
+        self._heights.insert(index, self._learn(row))
+        self._touch(index, shifted=True, columns=len(row))
+
+    def is_dirty(self, index):
+        """Return True if the row at index changed or moved since clean() was last called.
+
+        :param int index: Row index (not negative).
+
+        :return: If the row needs to be rendered again.
+        :rtype: bool
+        """
+        return index in self.dirty_rows or (self.shifted_from is not None and index >= self.shifted_from)
+
+    def set_cell(self, row, column, value):
+        """Change one cell.
+
+        :param int row: Row index.
+        :param int column: Column index (must be within the row).
+        :param str value: New cell contents.
+        """
+        cells = list(self._rows[row])
+        cells[column] = value
+        self[row] = cells
@@ -1,9 +1,9 @@
 """User-facing tables defined here."""
 
 import os
+from itertools import chain, count, islice
 
 from terminaltables.base_table import BaseTable
-from terminaltables.width_and_alignment import max_dimensions
 
 
 class AsciiTable(BaseTable):
@@ -30,12 +30,53 @@ class UnixTable(BaseTable):
     CHAR_INTERSECT_TOP = '\033(0\x77\033(B'
     CHAR_VERTICAL = '\033(0\x78\033(B'
 
-    @property
-    def table(self):
-        """Return a large string of the entire table ready to be printed to the terminal."""
-        ascii_table = super(UnixTable, self).table
-        optimized = ascii_table.replace('\033(B\033(0', '')
-        return optimized
+    def border(self, kind, widths):
+        """Return a border line with one shift-in/shift-out pair per run of box-drawing characters.
+
+        Merged borders are cached too, so adjacent escape sequences are removed once per distinct border.
+
+        :param str kind: One of 'top', 'bottom', or 'separator'.
+        :param iter widths: List of outer widths (with padding) for each column.
+
+        :return: Printable line.
+        :rtype: str
+        """
+        line = super(UnixTable, self).border(kind, widths)
+        key = ('merged', line)
+        merged = self._border_cache.get(key)
+        if merged is None:
+            merged = line.replace('\033(B\033(0', '')
+            self._border_cache.put(key, merged)
+        return merged
+
+    def iter_lines(self, start=0, stop=None, layout=None, heading=False):
+        """Yield each line of the table, with one escape sequence pair per run of box-drawing characters.
+
+        Padded cells are never empty so borders are the only lines with adjacent box-drawing characters, and those are
+        merged as they're built. Without padding, empty columns put vertical borders next to each other, as do tables
+        without any columns, and each line is merged after it's built.
+
+        :param int start: Index of the first row to render.
+        :param int stop: Index after the last row to render. None renders the rest of the table.
+        :param Layout layout: Layout of the whole table (e.g. from the `layout` property) to render with.
+        :param bool heading: Render the first (heading) row and its border above the others if start is past it.
+
+        :return: Yields printable lines.
+        """
+        if layout is None:
+            measure = self.profiler.wrap('max_dimensions', self.measure) if self.profiler else self.measure
+            layout = measure()
+        lines = super(UnixTable, self).iter_lines(start, stop, layout, heading)
+        if (self.padding_left or self.padding_right) and layout.inner_widths:
+            for line in lines:
+                yield line
+            return
+
+        merge = lambda line: line.replace('\033(B\033(0', '')
+        if self.profiler:
+            merge = self.profiler.wrap('escape_merge', merge)
+        for line in lines:
+            yield merge(line)
 
 
 class WindowsTable(BaseTable):
@@ -102,23 +143,59 @@ class GithubFlavoredMarkdownTable(BaseTable):
         # Github flavored markdown table won't support title.
         super(GithubFlavoredMarkdownTable, self).__init__(table_data)
 
-    @property
-    def table(self):
-        """Return a large string of the entire table ready to be printed to the terminal."""
-        column_widths = [c + self.padding_left + self.padding_right for c in self.column_widths]
-        widths, heights = max_dimensions(self.table_data)
-        final_table_data = list()
+    def iter_lines(self, start=0, stop=None, layout=None, heading=False):
+        """Yield each line of the table as soon as it is built, without trailing newlines.
 
-        for row_index, row_data in enumerate(self.table_data):
-            for line in self.gen_cell_lines(row_data, widths, heights[row_index]):
-                final_table_data.append(''.join(line))
+        Markdown has no way to add columns after the header separator, so with overflow 'widen' columns only grow
+        wider: cells past the last fixed or sampled column are dropped, like with the other overflow policies.
+
+        :param int start: Index of the first row to render.
+        :param int stop: Index after the last row to render. None renders the rest of the table.
+        :param Layout layout: Layout of the whole table (e.g. from the `layout` property) to render with.
+        :param bool heading: Render the first (heading) row and its separator above the others if start is past it.
+
+        :return: Yields printable lines.
+        """
+        if start < 0 or (stop is not None and stop < start):
+            raise ValueError('Invalid row range: {0}:{1}'.format(start, stop))
+
+        # Time each phase if profiling, otherwise call straight through.
+        measure, gen_cell_lines, join = self.measure, self.gen_cell_lines, ''.join
+        if self.profiler:
+            measure = self.profiler.wrap('max_dimensions', measure)
+            gen_cell_lines = self.profiler.wrap('gen_cell_lines', lambda *a: list(self.gen_cell_lines(*a)))
+            join = self.profiler.wrap('join', join)
+
+        if layout is None:
+            layout = measure()
+        widths = layout.inner_widths
+        render_row = self.row_renderer(layout, gen_cell_lines, join)
+        template = self.compile_row(widths) if layout.plain else None
+        format_plain = template and template.format_plain
+        if template and self.profiler:
+            format_plain = self.profiler.wrap('gen_cell_lines', format_plain)
+
+        rows = islice(self.gen_rows(layout, start), None if stop is None else stop - start)
+        indexes = count(start)  # Index of each row in table_data.
+        if heading and start:
+            rows, indexes = chain(islice(self.gen_rows(layout), 1), rows), chain([0], indexes)
+        for row_data, height, row_widths in rows:  # Row widths only differ from widths with overflow 'widen'.
+            row_index = next(indexes)
+            if len(row_widths) > len(widths):  # Columns added by 'widen'.
+                row_data, row_widths = row_data[:len(widths)], row_widths[:len(widths)]
+                height = max([c.count('\n') + 1 for c in row_data if c] or [0])
+            if template:
+                yield format_plain(row_data)
+            else:
+                for line in render_row(row_data, row_widths, height, row_index):
+                    yield line
 
             if row_index != 0:
                 continue
 
             # Header row separator.
             column_separators = []
-            for column_index, column_width in enumerate(column_widths):
+            for column_index, column_width in enumerate(layout.padding + w for w in row_widths):
                 column_justify = self.justify_columns.get(column_index)
                 if column_justify == 'left':
                     separator = ':' + self.CHAR_HORIZONTAL * (column_width - 1)
@@ -130,8 +207,4 @@ class GithubFlavoredMarkdownTable(BaseTable):
                 else:
                     separator = self.CHAR_HORIZONTAL * column_width
                 column_separators.append(separator)
-            final_table_data.append(
-                self.CHAR_VERTICAL + self.CHAR_VERTICAL.join(column_separators) + self.CHAR_VERTICAL
-            )
-
-        return '\n'.join(final_table_data)
+            yield self.CHAR_VERTICAL + self.CHAR_VERTICAL.join(column_separators) + self.CHAR_VERTICAL
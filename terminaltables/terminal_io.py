@@ -1,6 +1,8 @@
-"""Get info about the current terminal window/screen buffer."""
+"""Get info about the current terminal window/screen buffer.
+
+ctypes is only imported on Windows, when first needed, since it's slow to import and unused elsewhere.
+"""
 
-import ctypes
 import struct
 import sys
 
@@ -11,6 +13,8 @@ IS_WINDOWS = sys.platform == 'win32'
 STD_ERROR_HANDLE = -12
 STD_OUTPUT_HANDLE = -11
 
+_SIZE_CACHE = None
+
 
 def get_console_info(kernel32, handle):
     """Get information about this current console window (Windows only).
@@ -27,6 +31,7 @@ def get_console_info(kernel32, handle):
     """
     if handle == INVALID_HANDLE_VALUE:
         raise OSError('Invalid handle.')
+    import ctypes
 
     # Query Win32 API.
     lpcsbi = ctypes.create_string_buffer(22)  # Populated by GetConsoleScreenBufferInfo.
@@ -39,9 +44,123 @@ def get_console_info(kernel32, handle):
     return width, height
 
 
+class CachedTerminalSize(object):
+    """Remember the terminal size instead of querying the OS (an ioctl or Win32 call) every time it's needed.
+
+    The size is queried again after a SIGWINCH signal (the terminal was resized, see watch()) or invalidate(). A fixed
+    size may be set instead, e.g. to render for a width other than the terminal's or without any terminal at all.
+    """
+
+    def __init__(self, size=None):
+        """Constructor.
+
+        :param iter size: Fixed width and height to report instead of querying the terminal.
+        """
+        self.size = tuple(size) if size else None
+        self.watching = False
+        self._cached = None
+        self._previous_handler = None
+
+    def __call__(self):
+        """Return the fixed size, or the terminal's size (queried if it isn't cached).
+
+        :return: Width (number of characters) and height (number of lines) of the terminal.
+        :rtype: tuple
+        """
+        if self.size:
+            return self.size
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = query_terminal_size()
+        return cached
+
+    def _on_sigwinch(self, signum, frame):
+        """SIGWINCH handler. Invalidate and call the previous handler.
+
+        :param int signum: Signal number.
+        :param frame: Current stack frame.
+        """
+        self._cached = None
+        if callable(self._previous_handler):
+            self._previous_handler(signum, frame)
+
+    def invalidate(self):
+        """Forget the cached size so the terminal is queried again next time."""
+        self._cached = None
+
+    def watch(self):
+        """Invalidate the cached size whenever the terminal is resized. The previous SIGWINCH handler still gets called.
+
+        Signal handlers can only be set from the main thread and there's no SIGWINCH on Windows. Call invalidate()
+        yourself in those cases.
+
+        :return: If the SIGWINCH handler was installed.
+        :rtype: bool
+        """
+        import signal
+        if self.watching or not hasattr(signal, 'SIGWINCH'):
+            return self.watching
+        try:
+            self._previous_handler = signal.signal(signal.SIGWINCH, self._on_sigwinch)
+        except ValueError:  # Not the main thread.
+            return False
+        self.watching = True
+        return True
+
+    def unwatch(self):
+        """Restore the SIGWINCH handler replaced by watch()."""
+        if not self.watching:
+            return
+        import signal
+        previous = self._previous_handler
+        signal.signal(signal.SIGWINCH, signal.SIG_DFL if previous is None else previous)  # None if not set by Python.
+        self._previous_handler = None
+        self.watching = False
+
+
+def enable_terminal_size_cache(size=None, watch=True):
+    """Share one CachedTerminalSize between every table (and terminal_size() caller). Replaces any previous one.
+
+    :param iter size: Fixed width and height to report instead of querying the terminal.
+    :param bool watch: Query the terminal again after it's resized (SIGWINCH, main thread only).
+
+    :return: The new cache. Call its invalidate() method to query the terminal again.
+    :rtype: CachedTerminalSize
+    """
+    global _SIZE_CACHE  # pylint: disable=global-statement
+    disable_terminal_size_cache()
+    _SIZE_CACHE = CachedTerminalSize(size)
+    if watch and not size:
+        _SIZE_CACHE.watch()
+    return _SIZE_CACHE
+
+
+def disable_terminal_size_cache():
+    """Remove the cache added by enable_terminal_size_cache(), query the terminal every time again."""
+    global _SIZE_CACHE  # pylint: disable=global-statement
+    if _SIZE_CACHE is not None:
+        _SIZE_CACHE.unwatch()
+    _SIZE_CACHE = None
+
+
 def terminal_size(kernel32=None):
     """Get the width and height of the terminal.
 
+    Comes from the cache set up by enable_terminal_size_cache() if there is one.
+
+    :param kernel32: Optional mock kernel32 object. For testing. Bypasses the cache.
+
+    :return: Width (number of characters) and height (number of lines) of the terminal.
+    :rtype: tuple
+    """
+    if _SIZE_CACHE is not None and kernel32 is None:
+        return _SIZE_CACHE()
+    return query_terminal_size(kernel32)
+
+
+def query_terminal_size(kernel32=None):
+    """Ask the OS for the width and height of the terminal.
+
     http://code.activestate.com/recipes/440694-determine-size-of-console-window-on-windows/
     http://stackoverflow.com/questions/17993814/why-the-irrelevant-code-made-a-difference
 
@@ -51,7 +170,7 @@ def terminal_size(kernel32=None):
     :rtype: tuple
     """
     if IS_WINDOWS:
-        kernel32 = kernel32 or ctypes.windll.kernel32
+        kernel32 = kernel32 or __import__('ctypes').windll.kernel32
         try:
             return get_console_info(kernel32, kernel32.GetStdHandle(STD_ERROR_HANDLE))
         except OSError:
@@ -83,7 +202,7 @@ def set_terminal_title(title, kernel32=None):
         title_bytes = title
 
     if IS_WINDOWS:
-        kernel32 = kernel32 or ctypes.windll.kernel32
+        kernel32 = kernel32 or __import__('ctypes').windll.kernel32
         try:
             is_ascii = all(ord(c) < 128 for c in title)  # str/unicode.
         except TypeError:
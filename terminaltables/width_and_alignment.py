@@ -1,12 +1,120 @@
 """Functions that handle alignment, padding, widths, etc."""
 
 import re
-import unicodedata
+import sys
+from bisect import bisect_right
 
+from terminaltables import counters
+from terminaltables.cache import LRUCache
 from terminaltables.terminal_io import terminal_size
 
+ASTRAL_TABULATED_END = min(0x40000, sys.maxunicode + 1)  # Wide characters are tabulated below this code point.
+ELLIPSIS = '...'
+RE_ASCII_CONTROL = re.compile(r'[\x00-\x1f\x7f]')
 RE_COLOR_ANSI = re.compile(r'(\033\[[\d;]+m)')
 
+_ASTRAL_WIDE_ENDS = None
+_ASTRAL_WIDE_STARTS = None
+_BMP_WIDTHS = None
+_NUMPY_ENGINE = None  # (terminaltables.numpy_engine module, minimum number of cells) while enabled.
+_WIDTH_CACHE = None
+
+try:
+    unichr
+except NameError:
+    unichr = chr  # pylint: disable=invalid-name,redefined-builtin
+
+
+def is_ascii(string):
+    """Return True if the string only contains ASCII characters. Constant time on Python 3.7+.
+
+    :param str string: String to check.
+
+    :return: If every character is ASCII.
+    :rtype: bool
+    """
+    try:
+        return string.isascii()
+    except AttributeError:  # Python < 3.7.
+        try:
+            string.encode('ascii')
+        except UnicodeError:
+            return False
+        return True
+
+
+def _build_width_tables(astral=False):
+    """Build lookup tables of character widths from unicodedata. Called once per table, on first use.
+
+    Basic Multilingual Plane characters are looked up in a bytearray indexed by code point. Planes 1 to 3 (emoji, CJK
+    extensions) are stored as sorted ranges of wide characters for bisection. Higher planes have no assigned wide
+    characters so they aren't tabulated; visible_width() asks unicodedata directly in the unlikely event it sees one.
+
+    :param bool astral: Build the plane 1 to 3 ranges instead of the BMP bytearray.
+    """
+    global _BMP_WIDTHS, _ASTRAL_WIDE_STARTS, _ASTRAL_WIDE_ENDS  # pylint: disable=global-statement
+    import unicodedata  # Not needed until the first non-ASCII string, keep it out of import time.
+
+    if not astral:
+        bmp_widths = bytearray(b'\x01' * 0x10000)
+        for code in range(0x10000):
+            if unicodedata.east_asian_width(unichr(code)) in ('F', 'W'):
+                bmp_widths[code] = 2
+        _BMP_WIDTHS = bmp_widths
+        return
+
+    starts, ends = list(), list()
+    for code in range(0x10000, ASTRAL_TABULATED_END):
+        if unicodedata.east_asian_width(unichr(code)) not in ('F', 'W'):
+            continue
+        if ends and ends[-1] == code - 1:
+            ends[-1] = code
+        else:
+            starts.append(code)
+            ends.append(code)
+    _ASTRAL_WIDE_STARTS, _ASTRAL_WIDE_ENDS = starts, ends
+
+
+def enable_width_cache(maxsize=4096):
+    """Put a bounded LRU cache in front of visible_width(). Shared by every table in every thread.
+
+    Worth it when the same non-ASCII or colored strings are measured over and over (plain ASCII strings bypass the
+    cache since len() is cheaper than a lookup). Calling this again replaces the cache.
+
+    :param int maxsize: Maximum number of strings to remember.
+
+    :return: The new cache. Read its hits, misses, evictions, hit_rate, or stats attributes to tune maxsize.
+    :rtype: terminaltables.cache.LRUCache
+    """
+    global _WIDTH_CACHE  # pylint: disable=global-statement
+    _WIDTH_CACHE = LRUCache(maxsize)
+    return _WIDTH_CACHE
+
+
+def disable_width_cache():
+    """Remove the cache added by enable_width_cache()."""
+    global _WIDTH_CACHE  # pylint: disable=global-statement
+    _WIDTH_CACHE = None
+
+
+def enable_numpy_measurement(min_cells=100000):
+    """Measure tables of at least `min_cells` cells with terminaltables.numpy_engine instead of cell by cell.
+
+    Results are identical, see numpy_engine. Smaller tables aren't worth converting to arrays. Requires NumPy (raises
+    ImportError here if it's missing). Calling this again replaces the threshold.
+
+    :param int min_cells: Number of cells (rows times columns) above which NumPy is used.
+    """
+    global _NUMPY_ENGINE  # pylint: disable=global-statement
+    from terminaltables import numpy_engine
+    _NUMPY_ENGINE = (numpy_engine, min_cells)
+
+
+def disable_numpy_measurement():
+    """Measure every table cell by cell again."""
+    global _NUMPY_ENGINE  # pylint: disable=global-statement
+    _NUMPY_ENGINE = None
+
 
 def visible_width(string):
     """Get the visible width of a unicode string.
@@ -17,29 +125,102 @@ def visible_width(string):
 
     :param str string: String to measure.
 
+    :return: String's width.
+    :rtype: int
+    """
+    active = counters.ACTIVE
+    if active is not None:
+        active.visible_width_calls += 1
+        active.chars_scanned += len(string)
+
+    # ASCII characters are all one column wide.
+    if '\033' not in string and is_ascii(string):
+        return len(string)
+
+    cache = _WIDTH_CACHE
+    if cache is None:
+        return _visible_width(string)
+    width = cache.get(string)
+    if width is None:
+        width = _visible_width(string)
+        cache.put(string, width)
+    return width
+
+
+def _visible_width(string):
+    """Get the visible width of a string without the cache or the escape-free ASCII shortcut.
+
+    :param str string: String to measure.
+
     :return: String's width.
     :rtype: int
     """
     if '\033' in string:
         string = RE_COLOR_ANSI.sub('', string)
 
+    # ASCII characters are all one column wide.
+    if is_ascii(string):
+        return len(string)
+
     # Convert to unicode.
     try:
         string = string.decode('u8')
     except (AttributeError, UnicodeEncodeError):
         pass
 
+    if _BMP_WIDTHS is None:
+        _build_width_tables()
+    bmp_widths = _BMP_WIDTHS
+
     width = 0
+    if ord(max(string)) < 0x10000:
+        for char in string:
+            width += bmp_widths[ord(char)]
+        return width
+
+    if _ASTRAL_WIDE_STARTS is None:
+        _build_width_tables(astral=True)
     for char in string:
-        if unicodedata.east_asian_width(char) in ('F', 'W'):
-            width += 2
+        code = ord(char)
+        if code < 0x10000:
+            width += bmp_widths[code]
+        elif code < ASTRAL_TABULATED_END:
+            i = bisect_right(_ASTRAL_WIDE_STARTS, code) - 1
+            width += 2 if i >= 0 and code <= _ASTRAL_WIDE_ENDS[i] else 1
         else:
-            width += 1
+            width += 2 if __import__('unicodedata').east_asian_width(char) in ('F', 'W') else 1
 
     return width
 
 
-def align_and_pad_cell(string, align, inner_dimensions, padding, space=' '):
+def measure_cell(string):
+    """Split a cell into lines and measure the visible width of each line.
+
+    Lines are split the way align_and_pad_cell() expects them (empty strings and trailing newlines yield an empty line)
+    so it can consume the result directly instead of splitting and measuring the cell again.
+
+    :param str string: Cell contents.
+
+    :return: 2-item tuple of lists: lines and their visible widths.
+    :rtype: tuple
+    """
+    # Handle trailing newlines or empty strings, str.splitlines() does not satisfy.
+    lines = string.splitlines() or ['']
+    if string.endswith('\n'):
+        lines.append('')
+
+    ascii_only = '\033' not in string and is_ascii(string)
+    active = counters.ACTIVE
+    if active is not None:
+        active.splitlines_calls += 1
+        active.chars_scanned += len(string) if ascii_only else 0  # Otherwise counted by visible_width().
+
+    if ascii_only:
+        return lines, [len(line) for line in lines]
+    return lines, [visible_width(line) for line in lines]
+
+
+def align_and_pad_cell(string, align, inner_dimensions, padding, space=' ', measured=None):
     """Align a string horizontally and vertically. Also add additional padding in both dimensions.
 
     :param str string: Input string to operate on.
@@ -47,27 +228,38 @@ def align_and_pad_cell(string, align, inner_dimensions, padding, space=' '):
     :param tuple inner_dimensions: Width and height ints to expand string to without padding.
     :param iter padding: Number of space chars for left, right, top, and bottom (4 ints).
     :param str space: Character to use as white space for resizing/padding (use single visible chars only).
+    :param tuple measured: Optional measure_cell() return value for `string`, to avoid measuring it again.
 
     :return: Padded cell split into lines.
     :rtype: list
     """
-    # Handle trailing newlines or empty strings, str.splitlines() does not satisfy.
-    lines = string.splitlines() or ['']
-    if string.endswith('\n'):
-        lines.append('')
+    active = counters.ACTIVE
+    if measured:
+        lines, widths = measured
+    else:
+        # Handle trailing newlines or empty strings, str.splitlines() does not satisfy.
+        lines = string.splitlines() or ['']
+        if string.endswith('\n'):
+            lines.append('')
+        widths = [len(line) for line in lines] if '\033' not in string and is_ascii(string) else None
+        if active is not None:
+            active.splitlines_calls += 1
 
     # Vertically align and pad.
     if 'bottom' in align:
-        lines = ([''] * (inner_dimensions[1] - len(lines) + padding[2])) + lines + ([''] * padding[3])
+        top, bottom = inner_dimensions[1] - len(lines) + padding[2], padding[3]
     elif 'middle' in align:
         delta = inner_dimensions[1] - len(lines)
-        lines = ([''] * (delta // 2 + delta % 2 + padding[2])) + lines + ([''] * (delta // 2 + padding[3]))
+        top, bottom = delta // 2 + delta % 2 + padding[2], delta // 2 + padding[3]
     else:
-        lines = ([''] * padding[2]) + lines + ([''] * (inner_dimensions[1] - len(lines) + padding[3]))
+        top, bottom = padding[2], inner_dimensions[1] - len(lines) + padding[3]
+    lines = ([''] * top) + lines + ([''] * bottom)
+    if widths is not None:
+        widths = ([0] * top) + widths + ([0] * bottom)
 
     # Horizontally align and pad.
     for i, line in enumerate(lines):
-        new_width = inner_dimensions[0] + len(line) - visible_width(line)
+        new_width = inner_dimensions[0] + len(line) - (visible_width(line) if widths is None else widths[i])
         if 'right' in align:
             lines[i] = line.rjust(padding[0] + new_width, space) + (space * padding[1])
         elif 'center' in align:
@@ -75,30 +267,145 @@ def align_and_pad_cell(string, align, inner_dimensions, padding, space=' '):
         else:
             lines[i] = (space * padding[0]) + line.ljust(new_width + padding[1], space)
 
+    if active is not None:
+        active.padding_allocations += len(lines)
     return lines
 
 
-def max_dimensions(table_data, padding=None):
-    """Get maximum widths of each column and maximum height of each row.
+def split_at_width(string, width, force=True):
+    """Split a single line into a head that fits within `width` visible columns and the remaining tail.
 
-    If padding is not specified, inner dimensions are returned. If specified, outer dimensions are returned.
+    Color escape sequences take up no space and stay attached to the text that follows them. With `force` at least one
+    character is always moved to the head, even if it is wider than `width` (so wrapping always makes progress).
+
+    :param str string: Single line (no newline characters) to split.
+    :param int width: Maximum visible width of the head.
+    :param bool force: Move the first character to the head even if it doesn't fit.
+
+    :return: 2-item tuple of strings: head and tail (tail is empty if the whole string fits).
+    :rtype: tuple
+    """
+    head, used = list(), 0
+    parts = RE_COLOR_ANSI.split(string)
+    for i, part in enumerate(parts):
+        if i % 2:  # Color escape sequence.
+            head.append(part)
+            continue
+        for j, char in enumerate(part):
+            char_width = visible_width(char)
+            if used + char_width > width and (used or not force):
+                return ''.join(head), part[j:] + ''.join(parts[i + 1:])
+            head.append(char)
+            used += char_width
+    return ''.join(head), ''
+
+
+def fit_cell(string, width, overflow='truncate'):
+    """Fit every line of a cell within a fixed width by truncating or wrapping lines that are too wide.
+
+    Truncated lines keep the color escape sequences that were cut off so colors are still reset.
+
+    :param str string: Cell contents (may be multi-line).
+    :param int width: Maximum visible width of each line.
+    :param str overflow: What to do with lines wider than `width`: 'truncate', 'ellipsis' (truncate and end with
+        ELLIPSIS if there's room for it), or 'wrap'.
+
+    :return: Cell contents with no line wider than `width` (unless wrapping and one character is wider than `width`).
+    :rtype: str
+    """
+    if overflow not in ('truncate', 'ellipsis', 'wrap'):
+        raise ValueError('Invalid overflow: {0!r}'.format(overflow))
+    suffix = ELLIPSIS if overflow == 'ellipsis' and width > len(ELLIPSIS) else ''
+
+    fitted = list()
+    for line in string.split('\n'):
+        if visible_width(line) <= width:
+            fitted.append(line)
+        elif overflow == 'wrap':
+            while line:
+                head, line = split_at_width(line, width)
+                fitted.append(head)
+        else:
+            head, tail = split_at_width(line, width - len(suffix), force=False)
+            fitted.append(head + suffix + ''.join(RE_COLOR_ANSI.findall(tail)))
+
+    return '\n'.join(fitted)
+
+
+def measure_table(table_data, keep_cells=False):
+    """Get maximum widths of each column and maximum height of each row without padding, in one pass.
+
+    Also reports whether the table is "plain": every cell is a single line of ASCII without color escape sequences or
+    any other control characters. Such cells are as wide as they are long, so no width logic is needed to render them.
+
+    If table_data keeps its own dimensions up to date (a dimensions() method, see terminaltables.table_data) they're
+    returned without measuring anything. Large tables are measured with NumPy if enable_numpy_measurement() was called.
 
     :param iter table_data: List of list of strings (unmodified table data).
-    :param iter padding: Number of space chars for left, right, top, and bottom (4 ints).
+    :param bool keep_cells: Also return measure_cell() results for every cell, for align_and_pad_cell(). None in place
+        of ASCII cells without color codes (cheap to measure again) and skipped entirely for plain tables.
 
-    :return: 2-item tuple of n-item lists. Column widths and row heights.
+    :return: 4-item tuple: column widths (list), row heights (list), if the table is plain (bool), and a list of rows
+        of measure_cell() results (None unless keep_cells is True, the table isn't plain, and was measured here).
     :rtype: tuple
     """
+    dimensions = getattr(table_data, 'dimensions', None)
+    if dimensions is not None:
+        return dimensions()
+
     widths = [0] * (max(len(r) for r in table_data) if table_data else 0)
+    if _NUMPY_ENGINE is not None and len(table_data) * len(widths) >= _NUMPY_ENGINE[1]:
+        return _NUMPY_ENGINE[0].measure_table(table_data)
     heights = [0] * len(table_data)
+    plain = True
+    cells = list() if keep_cells else None
+    active = counters.ACTIVE
+    if active is not None:
+        active.measure_table_calls += 1
 
     # Find max width and heights.
     for j, row in enumerate(table_data):
+        if keep_cells:
+            measured_row = list()
+            cells.append(measured_row)
         for i, cell in enumerate(row):
             if not cell:
+                if keep_cells:
+                    measured_row.append(None)
                 continue
             heights[j] = max(heights[j], cell.count('\n') + 1)
-            widths[i] = max(widths[i], *[visible_width(l) for l in cell.splitlines()])
+            if '\033' not in cell and is_ascii(cell):
+                # Cheap enough for align_and_pad_cell() to re-split and len(), no record needed.
+                widths[i] = max(widths[i], *[len(line) for line in cell.splitlines()])
+                if active is not None:
+                    active.splitlines_calls += 1
+                    active.chars_scanned += len(cell)
+                if keep_cells:
+                    measured_row.append(None)
+                if plain and RE_ASCII_CONTROL.search(cell):
+                    plain = False
+                continue
+            measured = measure_cell(cell)
+            widths[i] = max(widths[i], *measured[1])
+            if keep_cells:
+                measured_row.append(measured)
+            plain = False
+
+    return widths, heights, plain, None if plain else cells
+
+
+def max_dimensions(table_data, padding=None):
+    """Get maximum widths of each column and maximum height of each row.
+
+    If padding is not specified, inner dimensions are returned. If specified, outer dimensions are returned.
+
+    :param iter table_data: List of list of strings (unmodified table data).
+    :param iter padding: Number of space chars for left, right, top, and bottom (4 ints).
+
+    :return: 2-item tuple of n-item lists. Column widths and row heights.
+    :rtype: tuple
+    """
+    widths, heights = measure_table(table_data)[:2]
 
     # Include padding in calculation.
     if padding and (padding[0] or padding[1]):
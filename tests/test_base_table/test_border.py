@@ -0,0 +1,41 @@
+"""Test method in BaseTable class."""
+
+from terminaltables import build
+from terminaltables.tables import AsciiTable, UnixTable
+
+
+def test_border():
+    """Test each kind of border."""
+    table = AsciiTable([], 'Title')
+    assert table.border('top', [3, 7]) == '+Title------+'
+    assert table.border('separator', [3, 7]) == '+---+-------+'
+    assert table.border('bottom', [3, 7]) == '+---+-------+'
+
+    table.outer_border = False
+    assert table.border('separator', [3, 7]) == '---+-------'
+
+    table = UnixTable([])
+    assert table.border('bottom', [1]) == '\033(0\x6d\x71\x6a\033(B'  # One escape sequence pair for the whole run.
+
+
+def test_reused(monkeypatch):
+    """Test that separators are built once per render and every border is cached between renders.
+
+    :param monkeypatch: pytest fixture.
+    """
+    calls = list()
+    original = build.build_border
+    monkeypatch.setattr('terminaltables.base_table.build_border', lambda *a: calls.append(a) or original(*a))
+
+    table = AsciiTable([['Row {0}'.format(i)] for i in range(100)])
+    table.inner_row_border = True
+    lines = list(table.iter_lines())
+    assert len(calls) == 2  # Top and separator. The bottom border has the same characters as separators here.
+    assert all(line is lines[2] for line in lines[2:-1:2])
+
+    assert '\n'.join(table.iter_lines()) == '\n'.join(lines)
+    assert len(calls) == 2
+
+    table.CHAR_HORIZONTAL = '='
+    assert table.table != '\n'.join(lines)
+    assert len(calls) == 4
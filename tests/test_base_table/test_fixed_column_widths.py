@@ -0,0 +1,124 @@
+"""Test streaming tables with fixed column widths."""
+
+import pytest
+
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+
+def gen_rows():
+    """Yield rows of a table one at a time.
+
+    :return: Yields lists of strings.
+    """
+    yield ['Name', 'Color', 'Type']
+    yield ['Avocado', 'green', 'nut']
+    yield ['Tomato', 'red', 'fruit']
+    yield ['Lettuce', 'green', 'vegetable']
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_matches_measured(cls):
+    """Test that fixed widths matching the measured widths render the same table from a generator.
+
+    :param cls: Table class to test.
+    """
+    expected = cls(list(gen_rows()))
+    expected.inner_footing_row_border = True
+    table = cls(gen_rows())
+    table.inner_footing_row_border = True
+    table.fixed_column_widths = expected.column_widths
+    assert table.column_widths == [7, 5, 9]
+    assert table.table_width == expected.table_width
+    assert table.table == expected.table
+
+
+def test_truncate():
+    """Test truncating over-wide cells."""
+    table = AsciiTable(gen_rows())
+    table.fixed_column_widths = [5, 3, 4]
+    expected = (
+        '+-------+-----+------+\n'
+        '| Name  | Col | Type |\n'
+        '+-------+-----+------+\n'
+        '| Avoca | gre | nut  |\n'
+        '| Tomat | red | frui |\n'
+        '| Lettu | gre | vege |\n'
+        '+-------+-----+------+'
+    )
+    assert table.table == expected
+
+
+def test_truncate_zero_width():
+    """Test that cells in zero-width or too narrow columns are truncated to nothing instead of overflowing."""
+    table = AsciiTable(iter([['hello', u'蓝色'], ['x', 'yy']]))
+    table.fixed_column_widths = [0, 1]
+    expected = (
+        '+--+---+\n'
+        '|  |   |\n'
+        '+--+---+\n'
+        '|  | y |\n'
+        '+--+---+'
+    )
+    assert table.table == expected
+
+
+def test_wrap():
+    """Test wrapping over-wide cells into multi-line cells."""
+    table = AsciiTable(iter([['Name', 'Type'], ['Lettuce', 'vegetable'], ['Extra', 'cells', 'dropped']]))
+    table.fixed_column_widths = [5, 4]
+    table.overflow = 'wrap'
+    table.inner_row_border = True
+    expected = (
+        '+-------+------+\n'
+        '| Name  | Type |\n'
+        '+-------+------+\n'
+        '| Lettu | vege |\n'
+        '| ce    | tabl |\n'
+        '|       | e    |\n'
+        '+-------+------+\n'
+        '| Extra | cell |\n'
+        '|       | s    |\n'
+        '+-------+------+'
+    )
+    assert table.table == expected
+
+
+@pytest.mark.parametrize('cls,expected', [
+    (AsciiTable, [
+        '+------+---+',
+        '| Name | C |',
+        '+------------+-------+',
+        '| Avocadoooo | green |',
+        '+------------+-------+-------+',
+        '| x          | y     | extra |',
+        '+------------+-------+-------+',
+    ]),
+    (GithubFlavoredMarkdownTable, [
+        '| Name | C |',
+        '|------|---|',
+        '| Avocadoooo | green |',
+        '| x          | y     |',  # Markdown can't add columns, extra cells are dropped.
+    ]),
+])
+def test_widen(cls, expected):
+    """Test widening columns, and adding columns for cells past the last one (except in Markdown tables).
+
+    :param cls: Table class to test.
+    :param list expected: Expected lines.
+    """
+    table = cls(iter([['Name', 'C'], ['Avocadoooo', 'green'], ['x', 'y', 'extra']]))
+    table.fixed_column_widths = [4, 1]
+    table.overflow = 'widen'
+    table.inner_heading_row_border = True
+    assert table.table.split('\n') == expected
+
+
+def test_lazy():
+    """Test that rows are pulled from table_data only as lines are consumed."""
+    consumed = list()
+    table = AsciiTable(consumed.append(r) or r for r in gen_rows())
+    table.fixed_column_widths = [7, 5, 9]
+    lines = table.iter_lines()
+    assert next(lines) == '+---------+-------+-----------+'
+    assert next(lines) == '| Name    | Color | Type      |'
+    assert len(consumed) <= 3
@@ -0,0 +1,87 @@
+"""Test methods in BaseTable class."""
+
+import pytest
+
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red', 'fruit'],
+    ['Lettuce', 'green', 'vegetable\nleafy'],
+]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_iter_lines(cls):
+    """Test that iter_lines() yields the same lines as the table property.
+
+    :param cls: Table class to test.
+    """
+    table = cls(TABLE_DATA)
+    table.inner_footing_row_border = True
+    lines = table.iter_lines()
+    assert not isinstance(lines, list)
+    assert list(lines) == table.table.split('\n')
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_write(cls):
+    """Test writing the table to a file-like object.
+
+    :param cls: Table class to test.
+    """
+    class Stream(object):
+        """Collects written str, unlike io.StringIO which only accepts unicode on Python 2."""
+
+        def __init__(self):
+            """Constructor."""
+            self.writes = list()
+
+        def write(self, data):
+            """Collect data.
+
+            :param str data: Written data.
+            """
+            self.writes.append(data)
+
+    table = cls(TABLE_DATA)
+    stream = Stream()
+    table.write(stream)
+    assert ''.join(stream.writes) == table.table + '\n'
+    assert len(stream.writes) == len(table.table.split('\n'))  # One line at a time.
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+@pytest.mark.parametrize('cell', [u'\u84dd\u8272', '\033[31mred\033[39m'])
+def test_write_memory(cls, cell):
+    """Test that streaming a table doesn't hold on to every cell's measurements (or lines) until the end.
+
+    :param cls: Table class to test.
+    :param str cell: Cell measured with measure_cell() (not plain).
+    """
+    tracemalloc = pytest.importorskip('tracemalloc')
+    table = cls([[cell + str(i), 'x', cell] for i in range(5000)])
+
+    class Stream(object):
+        """Discards written data."""
+
+        def write(self, data):
+            """Discard data.
+
+            :param str data: Written data.
+            """
+
+    tracemalloc.start()
+    try:
+        table.write(Stream())
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 1.5 * 1024 * 1024  # About 3 MB when keeping measurements.
+
+
+def test_empty():
+    """Test on empty tables."""
+    assert list(AsciiTable([]).iter_lines()) == ['++', '++']
+    assert list(GithubFlavoredMarkdownTable([]).iter_lines()) == []
@@ -0,0 +1,31 @@
+"""Test methods in BaseTable class."""
+
+import copy
+import pickle
+
+import pytest
+
+from terminaltables.tables import AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, SingleTable, UnixTable
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, SingleTable, DoubleTable, GithubFlavoredMarkdownTable])
+@pytest.mark.parametrize('clone', [copy.copy, copy.deepcopy, lambda t: pickle.loads(pickle.dumps(t))])
+def test_clone(cls, clone):
+    """Test copying and pickling tables, before and after rendering them (which fills their caches).
+
+    :param cls: Table class to test.
+    :param clone: Function returning a copy of a table.
+    """
+    table = cls([['Name', 'Color'], ['Avocado', 'green']])
+    table.title = 'Title'
+    table.justify_columns[1] = 'right'
+    assert clone(table).table == table.table
+
+    expected = table.table
+    other = clone(table)
+    assert other.table == expected
+    assert other.justify_columns == {1: 'right'}
+
+    other.table_data[1][0] = 'Tomato'
+    assert other.table != expected
+    assert clone(other).table == other.table
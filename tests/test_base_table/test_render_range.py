@@ -0,0 +1,122 @@
+"""Test method in BaseTable class."""
+
+import pytest
+
+from terminaltables import counters
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+TABLE_DATA = [['Name', 'Color'], ['Avocado', 'green'], ['Tomato', 'red'], ['Lettuce', 'green'], ['Total', '3']]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_whole(cls):
+    """Test that rendering every row is the same as the table property.
+
+    :param cls: Table class.
+    """
+    table = cls(TABLE_DATA)
+    assert table.render_range(0, None) == table.table
+    assert table.render_range(0, len(TABLE_DATA), table.layout) == table.table
+    assert table.render_range(0, 99) == table.table
+
+
+def test_ranges():
+    """Test borders around and between rows of a range."""
+    table = AsciiTable(TABLE_DATA)
+    table.inner_footing_row_border = True
+
+    assert table.render_range(1, 3) == (
+        '+---------+-------+\n'
+        '| Avocado | green |\n'
+        '| Tomato  | red   |\n'
+        '+---------+-------+'
+    )
+
+    # Heading border only if the next row is in range, footing border only if the last row is.
+    assert table.render_range(0, 1) == (
+        '+---------+-------+\n'
+        '| Name    | Color |\n'
+        '+---------+-------+'
+    )
+    assert table.render_range(3, 5) == (
+        '+---------+-------+\n'
+        '| Lettuce | green |\n'
+        '+---------+-------+\n'
+        '| Total   | 3     |\n'
+        '+---------+-------+'
+    )
+    assert table.render_range(3, 4) == table.render_range(3, 4, heading=False)
+    assert table.render_range(2, 2) == '+---------+-------+\n+---------+-------+'
+
+    # Heading pinned above the range.
+    assert table.render_range(2, 4, heading=True) == (
+        '+---------+-------+\n'
+        '| Name    | Color |\n'
+        '+---------+-------+\n'
+        '| Tomato  | red   |\n'
+        '| Lettuce | green |\n'
+        '+---------+-------+'
+    )
+    assert table.render_range(0, 2, heading=True) == table.render_range(0, 2)
+
+    with pytest.raises(ValueError):
+        table.render_range(-1, 2)
+    with pytest.raises(ValueError):
+        table.render_range(3, 2)
+
+
+def test_row_border_slice():
+    """Test that a range is the matching slice of the whole table."""
+    table = UnixTable([['Row {0}'.format(i), 'x' * (i % 7)] for i in range(30)], 'Title')
+    table.inner_row_border = True
+    lines = table.table.splitlines()
+    top, bottom = lines[0], lines[-1]
+
+    # Row i is on line 1 + 2 * i.
+    assert table.render_range(10, 13).splitlines() == [top] + lines[21:26] + [bottom]
+
+
+def test_github():
+    """Test GithubFlavoredMarkdownTable ranges."""
+    table = GithubFlavoredMarkdownTable(TABLE_DATA)
+    assert table.render_range(1, 3) == (
+        '| Avocado | green |\n'
+        '| Tomato  | red   |'
+    )
+    assert table.render_range(3, 4, heading=True) == (
+        '| Name    | Color |\n'
+        '|---------|-------|\n'
+        '| Lettuce | green |'
+    )
+
+
+@pytest.mark.parametrize('multi_line', [False, True])
+def test_proportional(multi_line):
+    """Test that rendering a range with a layout only does work for rows in the range.
+
+    :param bool multi_line: Use multi-line cells to take the non-template code path.
+    """
+    table = AsciiTable([['Row {0}'.format(i), 'two\nlines' if multi_line else 'one line'] for i in range(10000)])
+    layout = table.layout
+    active = counters.enable_counters()
+    try:
+        lines = table.render_range(5000, 5010, layout).splitlines()
+    finally:
+        counters.disable_counters()
+
+    assert lines[1].startswith('| Row 5000 |')
+    assert len(lines) == 2 + (20 if multi_line else 10)
+    assert active.measure_table_calls == 0
+    assert active.padding_allocations == (10 * 2 * 2 if multi_line else 10)
+
+
+def test_fixed_widths():
+    """Test skipping rows of a generator without measuring it."""
+    table = AsciiTable(['Row {0}'.format(i), 'abc'] for i in range(100))
+    table.fixed_column_widths = [6, 3]
+    assert table.render_range(98, 101) == (
+        '+--------+-----+\n'
+        '| Row 98 | abc |\n'
+        '| Row 99 | abc |\n'
+        '+--------+-----+'
+    )
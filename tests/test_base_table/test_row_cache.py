@@ -0,0 +1,93 @@
+# coding: utf-8
+"""Test row_cache attribute and row_renderer() method in BaseTable class."""
+
+import pytest
+
+from terminaltables.cache import LRUCache
+from terminaltables.profiling import Profiler
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+TABLE_DATA = [
+    ['Name', 'Color'],
+    ['Avocado', '\033[32mgreen\033[39m'],
+    ['Tomato', 'red\nish'],
+    [u'世界', 'blue'],
+    ['Avocado', '\033[32mgreen\033[39m'],
+]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_same_output(cls):
+    """Test that cached rows render the same as uncached ones.
+
+    :param cls: Table class.
+    """
+    table = cls([list(r) for r in TABLE_DATA])
+    expected = table.table
+    table.row_cache = LRUCache(100)
+
+    assert table.table == expected
+    assert table.row_cache.stats['hits'] == 1  # Last row is the same as the second.
+    assert table.row_cache.stats['size'] == 4
+    assert table.table == expected
+    assert table.row_cache.stats['hits'] == 1 + 5
+
+    table.table_data[3][1] = 'red'
+    assert table.table == cls(table.table_data).table
+    assert table.row_cache.stats['misses'] == 4 + 1
+
+
+def test_settings():
+    """Test that changing anything the lines depend on misses the cache."""
+    table = AsciiTable([list(r) for r in TABLE_DATA])
+    table.row_cache = LRUCache(100)
+    table.table
+    misses = table.row_cache.misses
+
+    for attribute, value in [('justify_columns', {1: 'right'}), ('padding_left', 2), ('inner_column_border', False),
+                             ('outer_border', False)]:
+        setattr(table, attribute, value)
+        fresh = AsciiTable(table.table_data)
+        vars(fresh).update((k, v) for k, v in vars(table).items() if k != 'row_cache')
+        assert table.table == fresh.table
+        assert table.row_cache.misses == misses + 4
+        misses = table.row_cache.misses
+
+    # Wider column.
+    table.table_data.append(['Lettuce', 'light green'])
+    table.table
+    assert table.row_cache.misses == misses + 5
+
+
+def test_shared():
+    """Test sharing one bounded cache between tables."""
+    cache = LRUCache(3)
+    first, second = AsciiTable([list(r) for r in TABLE_DATA]), UnixTable([list(r) for r in TABLE_DATA])
+    first.row_cache = second.row_cache = cache
+    first.table
+    assert len(cache) == 3
+    assert (cache.hits, cache.evictions) == (1, 1)  # Last row is the same as the second.
+
+    second.table  # Different vertical border characters, only its own repeated row is a hit.
+    assert (cache.hits, cache.evictions) == (2, 5)
+    assert len(cache) == 3
+
+
+def test_profiler():
+    """Test that cached rows skip gen_cell_lines()."""
+    table = AsciiTable([list(r) for r in TABLE_DATA])
+    table.row_cache = LRUCache(100)
+    table.profiler = Profiler()
+    table.table
+    assert table.profiler.calls['gen_cell_lines'] == 4
+    table.table
+    assert table.profiler.calls['gen_cell_lines'] == 4
+
+
+def test_plain():
+    """Test that plain tables render from their template without the cache."""
+    table = AsciiTable([['Name', 'Color'], ['Avocado', 'green']])
+    table.row_cache = LRUCache(100)
+    table.table
+    assert table.row_cache.stats['misses'] == 0
+    assert len(table.row_renderer(table.layout)(['a', 'b\nc'], [4, 5], 2, 0)) == 2
@@ -0,0 +1,106 @@
+"""Test streaming tables with column widths sampled from the first rows."""
+
+import pytest
+
+from terminaltables.tables import AsciiTable, UnixTable
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red', 'fruit'],
+    ['Lettuce', 'green', 'vegetable'],
+]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable])
+def test_sample_everything(cls):
+    """Test that sampling every row renders the same table as measuring the whole list.
+
+    :param cls: Table class to test.
+    """
+    expected = cls(TABLE_DATA).table
+    table = cls(iter(TABLE_DATA))
+    table.sample_rows = 10
+    assert table.column_widths == [7, 5, 9]
+    assert table.table == expected
+
+
+def test_sample_not_lost():
+    """Test that sampled rows of a generator are still rendered."""
+    table = AsciiTable(iter(TABLE_DATA))
+    table.sample_rows = 2
+    assert table.column_widths == [7, 5, 4]
+    assert table.column_widths == [7, 5, 4]
+    assert len(list(table.iter_lines())) == 7
+
+
+@pytest.mark.parametrize('overflow,expected', [
+    ('truncate', [
+        '| Tomato  | red   | frui |',
+        '| Lettuce | green | vege |',
+        '+---------+-------+------+',
+    ]),
+    ('ellipsis', [
+        '| Tomato  | red   | f... |',
+        '| Lettuce | green | v... |',
+        '+---------+-------+------+',
+    ]),
+    ('wrap', [
+        '| Tomato  | red   | frui |',
+        '|         |       | t    |',
+        '| Lettuce | green | vege |',
+        '|         |       | tabl |',
+        '|         |       | e    |',
+        '+---------+-------+------+',
+    ]),
+    ('widen', [
+        '+---------+-------+-------+',
+        '| Tomato  | red   | fruit |',
+        '+---------+-------+-----------+',
+        '| Lettuce | green | vegetable |',
+        '+---------+-------+-----------+',
+    ]),
+])
+def test_overflow(overflow, expected):
+    """Test overflow policies on rows after the sample.
+
+    :param str overflow: Overflow policy.
+    :param list expected: Expected lines after the sampled rows.
+    """
+    table = AsciiTable(iter(TABLE_DATA))
+    table.sample_rows = 2
+    table.overflow = overflow
+    lines = table.table.split('\n')
+    assert lines[:4] == [
+        '+---------+-------+------+',
+        '| Name    | Color | Type |',
+        '+---------+-------+------+',
+        '| Avocado | green | nut  |',
+    ]
+    assert lines[4:] == expected
+
+
+def test_widen_heading_separator():
+    """Test that a widened row right after the heading isn't preceded by two separators."""
+    table = AsciiTable(iter(TABLE_DATA))
+    table.sample_rows = 1
+    table.overflow = 'widen'
+    assert table.table.split('\n')[:4] == [
+        '+------+-------+------+',
+        '| Name | Color | Type |',
+        '+---------+-------+------+',
+        '| Avocado | green | nut  |',
+    ]
+
+
+@pytest.mark.parametrize('sample_rows', [0, -1])
+def test_invalid(sample_rows):
+    """Test rejecting samples without rows, which would truncate every cell to nothing.
+
+    :param int sample_rows: Table attribute.
+    """
+    table = AsciiTable(iter(TABLE_DATA))
+    table.sample_rows = sample_rows
+    with pytest.raises(ValueError):
+        table.table
+    assert len(list(table.table_data)) == 4  # Nothing read.
@@ -0,0 +1,91 @@
+"""Smoke test the benchmark suite."""
+
+import json
+
+from benchmarks import compare, run
+
+
+def test_run(monkeypatch, tmpdir):
+    """Test a tiny benchmark run end to end.
+
+    :param monkeypatch: pytest fixture.
+    :param tmpdir: pytest fixture.
+    """
+    monkeypatch.setattr('benchmarks.run.MIN_TIME', 0)
+    monkeypatch.setattr('benchmarks.run.calibrate', lambda repeat: (0.5, 1.5))
+    output = tmpdir.join('results.json')
+    assert run.main(['--sizes', '2', '--filter', 'shape=narrow/content=cjk/lines=multi', '-r', '2', '-o',
+                     str(output)]) == 0
+
+    report = json.loads(output.read())
+    assert report['meta']['python']
+    assert (report['meta']['calibration'], report['meta']['calibration_noise']) == (0.5, 1.5)
+    assert [r['name'] for r in report['results']] == [
+        'AsciiTable.table/rows=2/shape=narrow/content=cjk/lines=multi',
+        'max_dimensions/rows=2/shape=narrow/content=cjk/lines=multi',
+    ]
+    assert all(0 < r['best'] <= r['median'] and r['noise'] >= 0 and r['repeat'] == 2 for r in report['results'])
+
+
+def make_report(calibration, **timings):
+    """Build a minimal benchmark report.
+
+    :param float calibration: Calibration seconds.
+    :param timings: Scenario names mapped to median seconds, or to median seconds and percent noise.
+
+    :return: Report.
+    :rtype: dict
+    """
+    results = list()
+    for name, timing in sorted(timings.items()):
+        median, noise = timing if isinstance(timing, tuple) else (timing, 0.0)
+        results.append(dict(name=name, best=median * 0.9, median=median, noise=noise))
+    return dict(meta=dict(calibration=calibration), results=results)
+
+
+def test_median():
+    """Test the median of odd and even counts."""
+    assert compare.median([3, 1, 2]) == 2
+    assert compare.median([4, 1, 3, 2]) == 2.5
+    assert compare.median([7]) == 7
+
+
+def test_compare():
+    """Test normalizing for machine speed and computing changes."""
+    baseline = make_report(1.0, a=(1.0, 1.5), b=2.0, removed=1.0)
+    current = make_report(2.0, a=(2.0, 0.5), b=5.0, added=1.0)  # Machine is twice as slow.
+    rows = compare.compare(baseline, current)
+    assert [(n, round(c, 6), noise) for n, _, _, c, noise in rows] == [('a', 0.0, 2.0), ('b', 25.0, 0.0)]
+
+    # Calibration noise adds to every scenario.
+    baseline['meta']['calibration_noise'], current['meta']['calibration_noise'] = 0.5, 0.25
+    assert [r[4] for r in compare.compare(baseline, current)] == [2.75, 0.75]
+
+    # Reports without medians are compared on best timings.
+    del baseline['results'][0]['median']
+    assert compare.compare(baseline, current)[0][1:3] == (0.9, 1.8)
+
+
+def test_compare_main(tmpdir, capsys):
+    """Test exit status with and without regressions.
+
+    :param tmpdir: pytest fixture.
+    :param capsys: pytest fixture.
+    """
+    baseline, current = tmpdir.join('baseline.json'), tmpdir.join('current.json')
+    baseline.write(json.dumps(make_report(1.0, a=1.0, b=1.0, c=(1.0, 4.0))))
+    current.write(json.dumps(make_report(1.0, a=0.5, b=1.2, c=(1.2, 2.0))))
+
+    assert compare.main([str(baseline), str(current), '--threshold', '25']) == 0
+    assert compare.main([str(baseline), str(current), '--threshold', '10']) == 1
+    output = capsys.readouterr()[0]
+    assert '-50.0% (limit 25.0%)' in output
+    assert '+20.0% (limit 10.0%)  REGRESSION' in output
+    assert '3 scenarios compared, 2 regressed more than 10.0%.' in output
+
+    # Threshold sized to the noise: b is quiet (minimum threshold), c is noisy (6% noise).
+    assert compare.main([str(baseline), str(current)]) == 1
+    output = capsys.readouterr()[0]
+    assert '+20.0% (limit 5.0%)  REGRESSION' in output
+    assert '+20.0% (limit 24.0%)\n' in output
+    assert '3 scenarios compared, 1 regressed more than their noise.' in output
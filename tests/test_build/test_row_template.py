@@ -0,0 +1,63 @@
+# coding: utf-8
+"""Test class in module."""
+
+import pytest
+
+from terminaltables.base_table import BaseTable
+from terminaltables.build import RowTemplate
+
+
+@pytest.mark.parametrize('justify', [None, 'left', 'right', 'center'])
+@pytest.mark.parametrize('borders', [True, False])
+@pytest.mark.parametrize('row', [
+    ['Row One Column One', 'Two', 'Three'],
+    ['Short', '', 'Odd'],
+    ['Missing'],
+    [],
+    ['Multi\nLine', 'Two', ''],
+    [u'蓝色', '\033[31mRed\033[39m', 'Tab\tbed'],
+])
+def test_same_as_gen_cell_lines(row, borders, justify):
+    """Test that compiled templates match BaseTable.gen_cell_lines().
+
+    :param list row: Row to render.
+    :param bool borders: Toggle outer and inner column borders.
+    :param str justify: Justification of every column.
+    """
+    widths = [18, 4, 8]
+    table = BaseTable([row])
+    table.outer_border = table.inner_column_border = borders
+    table.padding_left, table.padding_right = 2, 0
+    table.justify_columns = dict((i, justify) for i in range(3))
+
+    height = max([c.count('\n') + 1 for c in row if c] or [0])
+    expected = [''.join(line) for line in table.gen_cell_lines(row, widths, height)]
+    template = table.compile_row(widths)
+    assert template.format(row) == expected
+    assert template.format(tuple(row)) == expected
+
+
+@pytest.mark.parametrize('justify', [None, 'right', 'center'])
+@pytest.mark.parametrize('row', [['Row One Column One', 'Two', 'Three'], ['Missing'], []])
+def test_format_plain(row, justify):
+    """Test rendering rows already known to be plain ASCII.
+
+    :param list row: Row to render.
+    :param str justify: Justification of every column.
+    """
+    template = RowTemplate([18, 4, 8], dict((i, justify) for i in range(3)), (1, 1), ('|', '|', '|'))
+    assert [template.format_plain(row)] == template.format(row)
+    assert [template.format_plain(tuple(row))] == template.format(row)
+
+
+def test_escape_braces():
+    """Test border characters that are also str.format() syntax."""
+    template = RowTemplate([3, 1], dict(), (1, 1), ('{', '}', '{}'))
+    assert template.template == '{{ {0:<3} }} {1:<1} {{}}'
+    assert template.format(['abc', 'd']) == ['{ abc } d {}']
+
+
+def test_no_columns():
+    """Test with zero columns."""
+    table = BaseTable([])
+    assert table.compile_row().format([]) == [''.join(next(table.gen_cell_lines([], [], 1)))] == ['||']
@@ -0,0 +1,62 @@
+"""Test LRUCache class."""
+
+import threading
+
+import pytest
+
+from terminaltables.cache import LRUCache
+
+
+def test_get_put():
+    """Test hits, misses, and least recently used eviction."""
+    cache = LRUCache(2)
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now least recently used.
+    cache.put('c', 3)
+    assert len(cache) == 2
+    assert cache.get('b', 'missing') == 'missing'
+    assert cache.get('c') == 3
+    assert cache.get('a') == 1
+
+    cache.put('a', 10)  # Update doesn't evict.
+    assert cache.get('a') == 10
+    assert cache.stats == dict(hits=4, misses=2, evictions=1, hit_rate=4 / 6.0, size=2, maxsize=2)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get('a') is None
+    assert cache.stats == dict(hits=0, misses=1, evictions=0, hit_rate=0.0, size=0, maxsize=2)
+
+
+def test_invalid_maxsize():
+    """Test zero maxsize."""
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_threads():
+    """Test concurrent access from multiple threads keeps the cache consistent."""
+    cache = LRUCache(50)
+
+    def worker(offset):
+        """Hammer the cache.
+
+        :param int offset: Key offset.
+        """
+        for i in range(2000):
+            key = (i + offset) % 80
+            if cache.get(key) is None:
+                cache.put(key, key * 2)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 50
+    assert cache.hits + cache.misses == 16000
+    assert 0 < cache.evictions <= cache.misses - 50
+    assert all(cache.get(k) in (None, k * 2) for k in range(80))
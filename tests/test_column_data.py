@@ -0,0 +1,85 @@
+# coding: utf-8
+"""Test ColumnData class."""
+
+import random
+
+import pytest
+
+from terminaltables import counters
+from terminaltables.column_data import ColumnData
+from terminaltables.tables import AsciiTable
+from terminaltables.width_and_alignment import measure_table
+
+CELLS = ('', 'a', 'abc', 'two\nlines', u'世界', '\033[31mred\033[39m', 'x\n', 'tab\there')
+
+
+def test_rows():
+    """Test rows built from a dict of columns, with format specs and callables."""
+    columns = dict(name=['Avocado', 'Tomato'], price=[1.5, 0.25], count=[3, 1200])
+    table_data = ColumnData(columns, formats={'price': '.2f', 'count': ','})
+    expected = [dict(name='Avocado', price='1.50', count='3'), dict(name='Tomato', price='0.25', count='1,200')]
+    expected = [[r[n] for n in table_data.names] for r in expected]  # Dict order varies on old Pythons.
+    assert sorted(table_data.names) == ['count', 'name', 'price']
+    assert list(table_data) == [table_data.names] + expected
+    assert table_data[-1] == expected[1]
+    assert table_data[1:] == expected
+    assert len(table_data) == 3
+    with pytest.raises(IndexError):
+        table_data[3]
+    with pytest.raises(IndexError):
+        table_data[-4]
+
+    table_data = ColumnData([['a', 'b', 'c'], [1]], names=['Letter', 'Number'], formats={1: lambda v: '#' * v})
+    assert list(table_data) == [['Letter', 'Number'], ['a', '#'], ['b', ''], ['c', '']]
+
+    table_data = ColumnData([['a', 'b'], ['c', 'd']])
+    assert (table_data.names, table_data.heading) == (None, False)
+    assert list(table_data) == [['a', 'c'], ['b', 'd']]
+    assert list(ColumnData(dict(x=['1']), heading=False)) == [['1']]
+
+
+def test_dimensions():
+    """Test that measuring column by column gives the same results as measure_table() on the rows."""
+    rng = random.Random(0)
+    for _ in range(300):
+        columns = [[rng.choice(CELLS) for _ in range(rng.randint(0, 5))] for _ in range(rng.randint(0, 3))]
+        names = [rng.choice(CELLS) for _ in columns] if rng.randint(0, 1) else None
+        table_data = ColumnData(columns, names=names)
+        assert table_data.dimensions() == measure_table([list(r) for r in table_data])[:3] + (None,)
+
+
+def test_table():
+    """Test rendering, and that rows are only built to render them."""
+    columns = dict(name=['Avocado', 'Tomato', u'世界'], color=['green', 'red\nish', 'blue'])
+    table = AsciiTable(ColumnData(columns, names=['Name', 'Color']))
+    expected = AsciiTable([['Name', 'Color'], ['Avocado', 'green'], ['Tomato', 'red\nish'], [u'世界', 'blue']]).table
+    active = counters.enable_counters()
+    try:
+        assert table.table == expected
+        assert active.measure_table_calls == 1
+    finally:
+        counters.disable_counters()
+
+    columns['name'][0] = 'Avocados'  # Columns aren't copied.
+    assert table.table_data[1] == ['Avocados', 'green']
+
+
+def test_numpy():
+    """Test NumPy structured arrays and arrays of str."""
+    numpy = pytest.importorskip('numpy')
+    array = numpy.zeros(3, dtype=[('host', 'U16'), ('load', 'f8'), ('up', '?')])
+    array['host'] = ['web-1', u'数据库', 'cache\n(old)']
+    array['load'] = [0.5, 12.25, 3]
+    array['up'] = [True, False, True]
+
+    table_data = ColumnData(array, formats={'load': '.1f'})
+    rows = [
+        ['host', 'load', 'up'],
+        ['web-1', '0.5', 'True'],
+        [u'数据库', '12.2', 'False'],
+        ['cache\n(old)', '3.0', 'True'],
+    ]
+    assert list(table_data) == rows
+    assert table_data.format_column(0).dtype == array.dtype['host']  # Measured without formatting.
+    assert table_data.dimensions() == measure_table(rows)[:3] + (None,)
+    assert AsciiTable(table_data).table == AsciiTable(rows).table
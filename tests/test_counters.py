@@ -0,0 +1,102 @@
+"""Test operation counters, and that rendering does O(N) work for N rows."""
+
+import pytest
+
+from terminaltables import counters
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+ROWS = {
+    'plain': lambda i: ['Row {0}'.format(i), 'host-{0}.example.com'.format(i), 'OK'],
+    'multi-line': lambda i: ['Row\n{0}'.format(i), 'host-{0}'.format(i), ''],
+    'cjk': lambda i: [u'行 {0}'.format(i), u'日本語\n{0}'.format(i), 'OK'],
+    'colored': lambda i: ['\033[31mRow {0}\033[39m'.format(i), 'host', 'OK'],
+}
+
+
+@pytest.fixture
+def active():
+    """Enable counters for one test.
+
+    :return: Counters being incremented.
+    :rtype: terminaltables.counters.OperationCounters
+    """
+    yield counters.enable_counters()
+    counters.disable_counters()
+
+
+def test_enable_disable():
+    """Test enabling, resetting, and disabling."""
+    active = counters.enable_counters()
+    try:
+        AsciiTable([['a', 'b']]).table
+        assert active.measure_table_calls == 1
+        assert counters.enable_counters() is not active  # Starts over.
+        counters.ACTIVE.reset()
+        assert set(counters.ACTIVE.stats.values()) == set([0])
+    finally:
+        counters.disable_counters()
+
+    assert counters.ACTIVE is None
+    AsciiTable([['a', 'b']]).table
+    assert active.measure_table_calls == 1
+
+
+def render_counts(cls, kind, size):
+    """Render a new table and return the counters.
+
+    :param cls: Table class.
+    :param str kind: Key of ROWS.
+    :param int size: Number of rows.
+
+    :return: Counters of one render.
+    :rtype: dict
+    """
+    table = cls([ROWS[kind](i) for i in range(size)])
+    active = counters.enable_counters()
+    table.table
+    return active.stats
+
+
+@pytest.mark.usefixtures('active')
+@pytest.mark.parametrize('kind', sorted(ROWS))
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_linear(cls, kind):
+    """Test that doubling the rows doubles the work (besides a constant overhead).
+
+    :param cls: Table class.
+    :param str kind: Key of ROWS.
+    """
+    small, medium, large = [render_counts(cls, kind, n) for n in (100, 200, 400)]
+    for field in counters.OperationCounters.FIELDS:
+        assert large[field] - medium[field] == 2 * (medium[field] - small[field]), field
+
+    assert small['measure_table_calls'] == 1
+    assert small['build_border_calls'] == {AsciiTable: 2, UnixTable: 3}.get(cls, 0)  # Ascii separators equal bottom.
+    assert small['padding_allocations'] >= 100
+
+
+@pytest.mark.usefixtures('active')
+def test_cached_borders():
+    """Test that rendering again doesn't rebuild borders."""
+    table = AsciiTable([ROWS['plain'](i) for i in range(10)])
+    table.table
+    active = counters.enable_counters()
+    table.table
+    assert active.build_border_calls == 0
+    assert active.measure_table_calls == 1
+
+
+def test_counts(active):
+    """Test exact counts for a small table.
+
+    :param active: Fixture.
+    """
+    AsciiTable([['a\nb', u'日本'], ['cd', '']]).table
+    assert active.stats == dict(
+        build_border_calls=2,  # Top, then separator and bottom are the same string.
+        chars_scanned=3 + 2 + 2,  # ASCII cells by measure_table(), the CJK cell by visible_width().
+        measure_table_calls=1,
+        padding_allocations=4 + 2,  # Two columns of two lines, then two columns of one line.
+        splitlines_calls=2 + 1 + 3,  # Two ASCII cells measured, the CJK one kept, three other cells re-split to pad.
+        visible_width_calls=1,
+    )
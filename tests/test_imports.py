@@ -0,0 +1,67 @@
+"""Test that importing terminaltables defers everything it can."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import terminaltables
+
+LAZY = sys.version_info >= (3, 7)
+PRINT_MODULES = 'import sys; print(" ".join(sorted(m for m in sys.modules if m.split(".")[0] in {0!r})))'.format(
+    ('terminaltables', 'ctypes', 'unicodedata')
+)
+
+
+def loaded_modules(code):
+    """Run code in a new interpreter and return the interesting modules it imported.
+
+    :param str code: Python statements.
+
+    :return: Sorted module names.
+    :rtype: list
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(terminaltables.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.check_output([sys.executable, '-c', code + '; ' + PRINT_MODULES], env=env)
+    return output.decode('ascii').split()
+
+
+@pytest.mark.skipif(not LAZY, reason='Requires module __getattr__.')
+def test_import():
+    """Test that importing the package imports nothing else."""
+    assert loaded_modules('import terminaltables') == ['terminaltables']
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Windows needs ctypes.')
+def test_render():
+    """Test that rendering imports neither ctypes nor (for ASCII tables) unicodedata."""
+    modules = loaded_modules('from terminaltables import AsciiTable; AsciiTable([["a"]]).table; AsciiTable([]).ok')
+    assert 'terminaltables.tables' in modules
+    assert 'ctypes' not in modules
+    assert 'unicodedata' not in modules
+
+
+def test_attributes():
+    """Test accessing table classes through the package."""
+    from terminaltables.tables import AsciiTable, SingleTable
+    assert terminaltables.AsciiTable is AsciiTable
+    assert getattr(terminaltables, 'SingleTable') is SingleTable
+    assert set(terminaltables.__all__) <= set(dir(terminaltables))
+    with pytest.raises(AttributeError):
+        getattr(terminaltables, 'BaseTable')
+
+
+def test_submodules():
+    """Test accessing submodules as attributes after a plain import, like when table classes were imported eagerly."""
+    code = 'import terminaltables; terminaltables.tables.AsciiTable; terminaltables.width_and_alignment.visible_width'
+    modules = loaded_modules(code + '; terminaltables.build.build_row; terminaltables.terminal_io.terminal_size')
+    for name in ('build', 'tables', 'terminal_io', 'width_and_alignment'):
+        assert 'terminaltables.' + name in modules
+
+    assert terminaltables.tables.AsciiTable is terminaltables.AsciiTable
+    with pytest.raises(AttributeError):
+        getattr(terminaltables, 'no_such_module')
+    with pytest.raises(AttributeError):
+        getattr(terminaltables, '__no_such_dunder__')
@@ -0,0 +1,51 @@
+"""Test Layout class."""
+
+import pytest
+
+from terminaltables import width_and_alignment
+from terminaltables.layout import Layout
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red', 'fruit'],
+    ['Lettuce', 'green', 'vegetable\nleafy'],
+]
+
+
+def test_measure():
+    """Test dimensions against the standalone width_and_alignment functions."""
+    layout = Layout.measure(TABLE_DATA, 2, 2, 1)
+    assert layout.inner_widths == [7, 5, 9]
+    assert layout.inner_heights == [1, 1, 1, 2]
+    assert layout.outer_widths == [9, 7, 11]
+    assert layout.table_width == width_and_alignment.table_width(TABLE_DATA, 2, 1, 2) == 31
+    for column_number in range(3):
+        expected = width_and_alignment.column_max_width(TABLE_DATA, column_number, 2, 1, 2)
+        assert layout.column_max_width(column_number, 80) == expected
+
+
+def test_empty():
+    """Test on empty tables."""
+    layout = Layout.measure([], 2, 2, 1)
+    assert layout.inner_widths == layout.inner_heights == layout.outer_widths == []
+    assert layout.table_width == 2
+    with pytest.raises(IndexError):
+        layout.column_max_width(0, 80)
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_single_pass(monkeypatch, cls):
+    """Test that rendering a table measures table data only once.
+
+    :param monkeypatch: pytest fixture.
+    :param cls: Table class to test.
+    """
+    calls = list()
+    original = width_and_alignment.measure_table
+    monkeypatch.setattr('terminaltables.layout.measure_table', lambda *a: calls.append(a) or original(*a))
+
+    table = cls(TABLE_DATA)
+    assert table.table
+    assert len(calls) == 1
@@ -0,0 +1,181 @@
+# coding: utf-8
+"""Test LiveTable class and terminal update functions."""
+
+import re
+
+import pytest
+
+from terminaltables.live import changed_lines, LiveTable, update_terminal
+from terminaltables.table_data import TableData
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+RE_OUTPUT = re.compile(r'\033\[(\d*)([ABJK])|(\r)|(\n)|((?:\033[()].|[^\033\r\n])+)')
+
+
+class FakeTerminal(object):
+    """Screen that interprets the output of update_terminal()."""
+
+    def __init__(self):
+        """Constructor."""
+        self.screen = ['']
+        self.row = self.column = 0
+
+    def flush(self):
+        """Do nothing, like a flushed stream."""
+
+    def write(self, output):
+        """Apply output to the screen.
+
+        :param str output: Text and escape sequences.
+        """
+        for count, command, carriage_return, newline, text in RE_OUTPUT.findall(output):
+            if carriage_return:
+                self.column = 0
+            elif newline:
+                self.row, self.column = self.row + 1, 0
+                if self.row == len(self.screen):
+                    self.screen.append('')
+            elif text:
+                line = self.screen[self.row].ljust(self.column)
+                self.screen[self.row] = line[:self.column] + text + line[self.column + len(text):]
+                self.column += len(text)
+            elif command == 'A':
+                self.row -= int(count)
+                assert self.row >= 0
+            elif command == 'B':
+                self.row += int(count)
+                assert self.row < len(self.screen)
+            elif command == 'K':
+                self.screen[self.row] = self.screen[self.row][:self.column]
+            elif command == 'J':
+                self.screen[self.row] = self.screen[self.row][:self.column]
+                del self.screen[self.row + 1:]
+
+    @property
+    def lines(self):
+        """Lines above the cursor, which must be at the start of a line."""
+        assert self.column == 0
+        return self.screen[:self.row]
+
+
+def test_changed_lines():
+    """Test finding lines to rewrite."""
+    assert changed_lines([], []) == []
+    assert changed_lines(['a', 'b', 'c'], ['a', 'x', 'c', 'd']) == [1, 3]
+    assert changed_lines(['a', 'b', 'c'], ['x']) == [0]
+
+
+@pytest.mark.parametrize('old,new', [
+    ([], ['a', 'b']),
+    (['a', 'b'], ['a', 'b']),
+    (['a', 'b', 'c'], ['a', 'x', 'c']),
+    (['long line', 'b'], ['short', 'b']),
+    (['a', 'b'], ['x', 'b', 'c', 'd']),
+    (['a', 'b', 'c', 'd'], ['a', 'x']),
+    (['a', 'b', 'c', 'd'], ['a', 'b']),
+    (['a', 'b'], []),
+])
+def test_update_terminal(old, new):
+    """Test that the screen shows new lines after the update.
+
+    :param list old: Lines on the screen.
+    :param list new: Lines to show.
+    """
+    terminal = FakeTerminal()
+    terminal.write(update_terminal([], old))
+    assert terminal.lines == old
+
+    output = update_terminal(old, new)
+    terminal.write(output)
+    assert terminal.lines == new
+    assert terminal.screen[len(new):] == ['']
+    if old == new:
+        assert output == ''
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable])
+def test_dirty_rows(cls):
+    """Test that only changed rows of a TableData are rendered again.
+
+    :param cls: Table class.
+    """
+    table = cls(TableData([['Name', 'Color'], ['Avocado', 'green'], ['Tomato', 'red'], ['Lettuce', 'green']]))
+    table.inner_footing_row_border = True
+    terminal = FakeTerminal()
+    live = LiveTable(table, terminal)
+
+    assert live.refresh() == len(table.table.splitlines())
+    assert live.rendered_rows == 4
+    assert terminal.lines == table.table.splitlines()
+
+    assert live.refresh() == 0
+    assert live.rendered_rows == 0
+
+    table.table_data.set_cell(2, 1, 'blue')
+    assert live.refresh() == 1
+    assert live.rendered_rows == 1
+    assert terminal.lines == table.table.splitlines()
+
+    # Wider cell resizes a column, so everything is rendered again.
+    table.table_data.set_cell(2, 1, 'light blue')
+    assert live.refresh() == len(table.table.splitlines())
+    assert live.rendered_rows == 4
+    assert terminal.lines == table.table.splitlines()
+
+    # Taller row and more rows.
+    table.table_data.set_cell(1, 0, 'Avo\ncado')
+    table.table_data.append(['Total', '4'])
+    live.refresh()
+    assert live.rendered_rows == 5
+    assert terminal.lines == table.table.splitlines()
+
+    table.table_data.set_cell(1, 0, 'Avo\nCado')
+    assert live.refresh() == 1
+    assert live.rendered_rows == 1
+    assert terminal.lines == table.table.splitlines()
+
+    table.table_data.set_cell(0, 0, 'Fruit')
+    table.table_data.set_cell(4, 1, '5')
+    live.render()  # Not written to the terminal, the next refresh() still writes it.
+    assert live.rendered_rows == 2
+    assert live.refresh() == 2
+    assert live.rendered_rows == 0
+    assert terminal.lines == table.table.splitlines()
+
+    # Fewer rows.
+    del table.table_data[1:]
+    live.refresh()
+    assert terminal.lines == table.table.splitlines()
+
+    # Settings changes are noticed.
+    table.inner_row_border = True
+    table.table_data.extend([['a', 'b'], ['c', 'd']])
+    live.refresh()
+    table.outer_border = False
+    live.refresh()
+    assert terminal.lines == table.table.splitlines()
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, GithubFlavoredMarkdownTable])
+def test_full_render(cls):
+    """Test that plain lists and tables laid out differently are rendered in full every time.
+
+    :param cls: Table class.
+    """
+    table_data = [['Name', 'Color'], ['Avocado', 'green'], ['Tomato', 'red']]
+    table = cls(table_data if cls is AsciiTable else TableData(table_data))
+    terminal = FakeTerminal()
+    live = LiveTable(table, terminal)
+    live.refresh()
+
+    table.table_data[1] = ['Avocado', 'brown']
+    assert live.refresh() == 1
+    assert live.rendered_rows == 3
+    assert terminal.lines == table.table.splitlines()
+
+    # Replaced table_data isn't mistaken for changes to the old one.
+    table.table_data = TableData([['Name', 'Color'], ['Lettuce', 'green'], ['Tomato', 'red']])
+    table.table_data.clean()
+    live.refresh()
+    assert live.rendered_rows == 3
+    assert terminal.lines == table.table.splitlines()
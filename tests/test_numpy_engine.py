@@ -0,0 +1,110 @@
+# coding: utf-8
+"""Test NumPy measurement engine."""
+
+import random
+
+import pytest
+
+from terminaltables import width_and_alignment
+from terminaltables.tables import AsciiTable
+from terminaltables.width_and_alignment import measure_table
+
+numpy = pytest.importorskip('numpy')
+numpy_engine = pytest.importorskip('terminaltables.numpy_engine')
+
+CELLS = ('', 'a', 'abc', 'hostname.example.com', 'two\nlines', u'世界', u'蓝\n色蓝色', '\033[31mred\033[39m', 'x\n',
+         'a\x00b', 'x\x00', 'tab\there', 'a\rb', 'del\x7f', u'é', 'x\x0by', ' ~')
+
+
+def test_random():
+    """Test that results are identical to measure_table() for random tables, including ragged rows."""
+    rng = random.Random(0)
+    for _ in range(300):
+        rows = [[rng.choice(CELLS) for _ in range(rng.randint(0, 4))] for _ in range(rng.randint(0, 6))]
+        assert numpy_engine.measure_table(rows) == measure_table(rows)[:3] + (None,)
+
+
+def test_columns():
+    """Test measuring columns of different dtypes and lengths."""
+    columns = [
+        numpy.array(['Name', 'Avocado', 'Tomato']),
+        ['Color', u'蓝色', 'red\nish'],
+        numpy.arange(3) * 1000,
+        numpy.array(['Short']),
+    ]
+    rows = [['Name', 'Color', '0', 'Short'], ['Avocado', u'蓝色', '1000', ''], ['Tomato', 'red\nish', '2000']]
+    assert numpy_engine.measure_columns(columns) == measure_table(rows)[:3] + (None,)
+    assert numpy_engine.measure_columns([]) == ([], [], True, None)
+    assert numpy_engine.measure_columns([[], []]) == ([0, 0], [], True, None)
+
+
+def test_chunks(monkeypatch):
+    """Test classifying cells in several chunks, with some too long to go in arrays.
+
+    :param monkeypatch: pytest fixture.
+    """
+    monkeypatch.setattr(numpy_engine, 'CHUNK_BYTES', 48)
+    monkeypatch.setattr(numpy_engine, 'MAX_CELL_CHARS', 4)
+    rows = [[c, c * 3] for c in CELLS]
+    assert numpy_engine.measure_table(rows) == measure_table(rows)[:3] + (None,)
+    columns = [numpy.array([r[0] for r in rows]), numpy.array([r[1] for r in rows], dtype=object)]
+    rows = [[c, r[1]] for c, r in zip(columns[0], rows)]  # Arrays of str have no trailing NULs.
+    assert numpy_engine.measure_columns(columns) == measure_table(rows)[:3] + (None,)
+
+
+@pytest.mark.parametrize('long_cell', [
+    'x' * 100000,
+    'x\n' * 50000,
+    u'世' * 100000,
+    '\033[31m' + 'x' * 100000,
+], ids=['ascii', 'lines', 'cjk', 'color'])
+def test_long_cell(long_cell):
+    """Test that one very long cell doesn't size the array of every other cell (8 GB for this table).
+
+    :param str long_cell: Cell much longer than MAX_CELL_CHARS.
+    """
+    rows = [['a', 'bc']] * 20000
+    rows = rows[:10000] + [[long_cell, 'd']] + rows[10000:]
+    assert numpy_engine.measure_table(rows) == measure_table(rows)[:3] + (None,)
+
+    chunks = list(numpy_engine._gen_chunks([r[0] for r in rows]))  # pylint: disable=protected-access
+    assert [c[2] for c in chunks if c[2]] == [{10000 % len(chunks[0][1]): long_cell}]
+    assert max(c[1].nbytes for c in chunks) <= numpy_engine.CHUNK_BYTES
+
+
+def test_long_array(monkeypatch):
+    """Test that arrays of long str are classified a few cells at a time.
+
+    :param monkeypatch: pytest fixture.
+    """
+    array = numpy.array(['a'] * 30 + ['x' * 1000, u'世' * 1000])
+    monkeypatch.setattr(numpy_engine, 'CHUNK_BYTES', array.itemsize * 4)
+    chunks = list(numpy_engine._gen_chunks(array))  # pylint: disable=protected-access
+    assert [len(c[1]) for c in chunks] == [4] * 8
+    assert numpy_engine.measure_columns([array]) == measure_table([[c] for c in array])[:3] + (None,)
+
+
+def test_trailing_nul():
+    """Test that cells ending with NULs, which NumPy drops, are as wide as with the pure Python path."""
+    rows = [['a', 'c'], ['x\x00', 'yy']]
+    expected = AsciiTable(rows).table
+    width_and_alignment.enable_numpy_measurement(0)
+    try:
+        assert measure_table(rows)[:3] == ([2, 2], [1, 1], False)
+        assert AsciiTable(rows).table == expected
+    finally:
+        width_and_alignment.disable_numpy_measurement()
+
+
+def test_enable():
+    """Test using the engine for tables past the threshold."""
+    rows = [['Name', 'Color'], ['Avocado', 'green'], ['Tomato', u'红\n色'], ['Lettuce', '\033[32mgreen\033[39m']]
+    expected = AsciiTable(rows).table
+    width_and_alignment.enable_numpy_measurement(8)
+    try:
+        assert measure_table(rows)[3] is None  # Measured cells aren't kept by the engine.
+        assert measure_table(rows[:3], keep_cells=True)[3] is not None  # Too small.
+        assert AsciiTable(rows).table == expected
+    finally:
+        width_and_alignment.disable_numpy_measurement()
+    assert measure_table(rows, keep_cells=True)[3] is not None
@@ -0,0 +1,59 @@
+# coding: utf-8
+"""Test parallel rendering."""
+
+import random
+
+import pytest
+
+from terminaltables import parallel
+from terminaltables.table_data import TableData
+from terminaltables.tables import AsciiTable, GithubFlavoredMarkdownTable, UnixTable
+
+CELLS = ('', 'a', 'abc', 'two\nlines', u'世界', '\033[31mred\033[39m', 'x\n')
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_identical(cls):
+    """Test that output is identical to the table property with every border setting and chunk size.
+
+    :param cls: Table class.
+    """
+    rng = random.Random(cls.__name__)
+    for _ in range(8):
+        table = cls([[rng.choice(CELLS) for _ in range(rng.randint(0, 3))] for _ in range(rng.randint(2, 20))])
+        for attribute in ('inner_column_border', 'inner_footing_row_border', 'inner_heading_row_border',
+                          'inner_row_border', 'outer_border'):
+            setattr(table, attribute, rng.choice([True, False]))
+        if rng.randint(0, 2) == 0:
+            table.padding_left = table.padding_right = 0
+        table.justify_columns = {1: 'right'}
+        assert parallel.render_parallel(table, 2, rng.randint(1, 5), 0) == table.table
+
+
+def test_table_data():
+    """Test a table_data keeping its own dimensions, which isn't measured again."""
+    table = AsciiTable(TableData([['Name', 'Color'], ['Avocado', 'green'], ['Tomato', 'red\nish'], ['Total', '2']]))
+    table.inner_footing_row_border = True
+    assert parallel.render_parallel(table, 2, 1, 0) == table.table
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(processes=2),  # Fewer than MIN_ROWS.
+    dict(processes=1, min_rows=0),
+    dict(processes=2, min_rows=0, fixed_column_widths=[3, 1], table_data=(['Row', str(i)] for i in range(5))),
+    dict(processes=2, min_rows=0, fixed_column_widths=[3, 1]),
+    dict(processes=2, min_rows=0, sample_rows=2),
+])
+def test_no_pool(monkeypatch, kwargs):
+    """Test rendering without a pool when it isn't worth it or isn't possible.
+
+    :param monkeypatch: pytest fixture.
+    :param dict kwargs: Arguments and table attributes.
+    """
+    monkeypatch.setattr(parallel.multiprocessing, 'Pool', None)  # Fails if used.
+    table = AsciiTable([['Row', str(i)] for i in range(5)])
+    expected = table.table
+    for attribute in ('fixed_column_widths', 'sample_rows', 'table_data'):
+        if attribute in kwargs:
+            setattr(table, attribute, kwargs.pop(attribute))
+    assert parallel.render_parallel(table, **kwargs) == expected
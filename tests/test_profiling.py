@@ -0,0 +1,72 @@
+"""Test Profiler class and the profiler attribute of tables."""
+
+import pytest
+
+from terminaltables.base_table import BaseTable
+from terminaltables.profiling import Profiler
+from terminaltables.tables import GithubFlavoredMarkdownTable, UnixTable
+
+PLAIN = [['Name', 'Color'], ['Avocado', 'green'], ['Tomato', 'red']]
+MULTI_LINE = [['Name', 'Color'], ['Avocado', 'green\nish'], ['Tomato', 'red']]
+
+
+def test_record():
+    """Test recording, reporting, and resetting."""
+    seen = list()
+    profiler = Profiler(lambda phase, seconds: seen.append((phase, seconds)))
+    profiler.record('join', 0.25)
+    profiler.record('join', 0.5)
+    profiler.wrap('build_border', lambda a, b=0: a + b)(1, b=2)
+
+    assert profiler.calls == dict(join=2, build_border=1)
+    assert profiler.stats['join'] == (2, 0.75)
+    assert seen[:2] == [('join', 0.25), ('join', 0.5)]
+    assert seen[2][0] == 'build_border'
+    assert str(profiler).splitlines()[1].split() == ['join', '2', '0.750000']
+
+    profiler.reset()
+    assert profiler.stats == dict()
+
+
+@pytest.mark.parametrize('table_data', [PLAIN, MULTI_LINE])
+@pytest.mark.parametrize('cls', [BaseTable, UnixTable, GithubFlavoredMarkdownTable])
+def test_table(cls, table_data):
+    """Test that each phase is counted and output is unchanged.
+
+    :param cls: Table class to test.
+    :param list table_data: Table data to render.
+    """
+    table = cls(table_data)
+    expected = table.table
+
+    table.profiler = Profiler()
+    assert table.table == expected
+    calls = table.profiler.calls
+
+    assert calls['max_dimensions'] == 1
+    assert calls['gen_cell_lines'] == 3
+    if table_data is PLAIN:
+        assert calls['join'] == 1  # Rows come from a compiled template, only the final join remains.
+    else:
+        assert calls['join'] == 1 + 4  # Plus one per line of each row (one row has two lines).
+
+    if cls is GithubFlavoredMarkdownTable:
+        assert 'build_border' not in calls
+    else:
+        assert calls['build_border'] == 3  # Top, separator below the heading, and bottom.
+    assert 'escape_merge' not in calls  # UnixTable merges borders as they're built.
+
+    if cls is UnixTable:
+        table.padding_left = table.padding_right = 0
+        table.profiler.reset()
+        assert table.table
+        assert table.profiler.calls['escape_merge'] == len(expected.splitlines())
+
+
+def test_iter_lines():
+    """Test profiling a streamed table, which has no final join."""
+    table = BaseTable(PLAIN)
+    table.profiler = Profiler()
+    list(table.iter_lines())
+    assert 'join' not in table.profiler.calls
+    assert table.profiler.calls['gen_cell_lines'] == 3
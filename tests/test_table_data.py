@@ -0,0 +1,160 @@
+# coding: utf-8
+"""Test TableData class."""
+
+import random
+
+import pytest
+
+from terminaltables import counters
+from terminaltables.table_data import cell_dimensions, TableData
+from terminaltables.tables import AsciiTable
+from terminaltables.width_and_alignment import max_dimensions, measure_table
+
+CELLS = ('', 'a', 'abc', 'hostname.example.com', 'two\nlines', u'世界', u'蓝\n色蓝色', '\033[31mred\033[39m', 'x\n')
+
+
+def check(table_data):
+    """Assert that incrementally maintained dimensions match a full rescan.
+
+    :param TableData table_data: Instance to check.
+    """
+    expected = measure_table([list(r) for r in table_data])[:3]
+    assert table_data.dimensions()[:3] == expected
+
+
+@pytest.mark.parametrize('cell', CELLS)
+def test_cell_dimensions(cell):
+    """Test measuring single cells the way measure_table() does.
+
+    :param str cell: Cell contents.
+    """
+    widths, heights, plain = measure_table([[cell]])[:3]
+    assert cell_dimensions(cell) == (widths[0], heights[0], plain)
+
+
+def test_random():
+    """Test random appends, inserts, replacements, slices, and deletes."""
+    rng = random.Random(0)
+    gen_row = lambda: [rng.choice(CELLS) for _ in range(rng.randint(0, 4))]
+    table_data = TableData()
+    check(table_data)
+
+    for _ in range(500):
+        action = rng.randint(0, 6)
+        if action == 0 or len(table_data) < 3:
+            table_data.append(gen_row())
+        elif action == 1:
+            table_data.insert(rng.randint(0, len(table_data)), gen_row())
+        elif action == 2:
+            table_data[rng.randrange(len(table_data))] = gen_row()
+        elif action == 3:
+            del table_data[rng.randrange(len(table_data))]
+        elif action == 4:
+            start = rng.randrange(len(table_data))
+            table_data[start:start + 2] = [gen_row() for _ in range(rng.randint(0, 3))]
+        elif action == 5:
+            del table_data[::3]
+        else:
+            row = rng.randrange(len(table_data))
+            if table_data[row]:
+                table_data.set_cell(row, rng.randrange(len(table_data[row])), rng.choice(CELLS))
+        check(table_data)
+
+
+def test_widest_deleted():
+    """Test that deleting the widest cell shrinks the column without a rescan."""
+    table_data = TableData([['a', 'bb'], ['ccc', 'd'], ['ccc', '']])
+    assert table_data.dimensions() == ([3, 2], [1, 1, 1], True, None)
+    del table_data[1]
+    assert table_data.dimensions()[0] == [3, 2]
+    table_data.pop()
+    assert table_data.dimensions()[0] == [1, 2]
+    table_data.set_cell(0, 1, 'e')
+    assert table_data.dimensions()[0] == [1, 1]
+    table_data[0] = ['a']
+    assert table_data.dimensions()[0] == [1]
+    del table_data[:]
+    assert table_data.dimensions() == ([], [], True, None)
+
+    with pytest.raises(ValueError):
+        table_data[::2] = [['too'], ['many']]  # Extended slice of a different length, nothing changes.
+    assert len(table_data) == 0
+
+
+def test_table():
+    """Test rendering, and that an append doesn't rescan the table."""
+    rows = [['Name', 'Color'], ['Avocado', 'green'], [u'世界', 'red\nish']]
+    table = AsciiTable(TableData(rows))
+    assert table.table == AsciiTable(rows).table
+    assert max_dimensions(table.table_data) == max_dimensions(rows)
+
+    table.table_data.extend([['Lettuce', 'green']] * 1000)
+    active = counters.enable_counters()
+    try:
+        table.table_data.append(['Tomato', 'red'])
+        assert active.chars_scanned == len('Tomato') + len('red')
+        table.column_widths
+        assert active.measure_table_calls == 0
+        assert active.chars_scanned == len('Tomato') + len('red')
+    finally:
+        counters.disable_counters()
+    assert table.table == AsciiTable([list(r) for r in table.table_data]).table
+
+
+def test_dirty():
+    """Test recording changed rows and columns."""
+    table_data = TableData([['a', 'b'], ['c', 'd'], ['e', 'f']])
+    assert table_data.version == 3
+    assert table_data.shifted_from == 0  # Appended rows count as moved.
+    table_data.clean()
+    assert (table_data.dirty_rows, table_data.dirty_columns, table_data.shifted_from) == (set(), set(), None)
+    assert table_data.version == 3
+
+    table_data.set_cell(1, 1, 'D')
+    table_data[-1] = ['e', 'f', 'g']
+    assert table_data.version == 5
+    assert (table_data.dirty_rows, table_data.dirty_columns) == (set([1, 2]), set([1, 2]))
+    assert table_data.shifted_from is None
+    assert [table_data.is_dirty(i) for i in range(3)] == [False, True, True]
+
+    table_data.clean()
+    table_data[0:2] = [['a', 'x'], ['c', 'D']]  # Same length, replaced in place.
+    assert (table_data.dirty_rows, table_data.dirty_columns, table_data.shifted_from) == (set([0, 1]), set([1]), None)
+
+    table_data.clean()
+    table_data.append(['h'])
+    assert (table_data.dirty_rows, table_data.dirty_columns, table_data.shifted_from) == (set(), set([0]), 3)
+    del table_data[::-2]  # Rows 3 and 1.
+    assert table_data.shifted_from == 1
+    table_data.insert(-10, ['first'])
+    assert table_data.shifted_from == 0
+    assert table_data[0] == ['first']
+    assert all(table_data.is_dirty(i) for i in range(len(table_data)))
+
+    with pytest.raises(IndexError):
+        TableData()[0] = ['a']
+
+
+def test_layout_cached():
+    """Test that tables reuse their layout until table_data or layout settings change."""
+    table = AsciiTable(TableData([['Name', 'Color'], ['Avocado', 'green']]))
+    layout = table.layout
+    assert table.layout is layout
+    assert table.column_widths == [7, 5]
+
+    table.table_data.append(['Lettuce', 'light green'])
+    assert table.layout is not layout
+    assert table.column_widths == [7, 11]
+
+    layout = table.layout
+    table.padding_left = 2
+    assert table.layout is not layout
+    assert table.table_width == 2 + 1 + 10 + 14
+
+    layout = table.layout
+    table.table_data = TableData(table.table_data)
+    assert table.layout is not layout
+    assert table.layout.inner_widths == layout.inner_widths
+
+    table.table_data = [list(r) for r in table.table_data]  # Plain lists are measured every time.
+    assert table.layout is not table.layout
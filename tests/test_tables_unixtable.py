@@ -1,5 +1,8 @@
 """Test end to end showing Unix-characters table."""
 
+import pytest
+
+from terminaltables.base_table import BaseTable
 from terminaltables.tables import UnixTable
 
 
@@ -28,3 +31,51 @@ def test_simple():
         '\x71\x71\x71\x71\x71\x6a\033(B'
     )
     assert table.table == expected
+
+
+# UnixTable characters without merging escape sequences.
+UnmergedTable = type('UnmergedTable', (BaseTable,), dict(i for i in vars(UnixTable).items() if i[0][:5] == 'CHAR_'))
+
+
+@pytest.mark.parametrize('table_data', [
+    [
+        ['Name', '', 'Type'],
+        ['Avocado', '', 'nut\n\033[31mred\033[39m'],
+        ['', '', ''],
+        [u'\u65e5\u672c', '', 'vegetable'],
+    ],
+    [['', ''], ['', '']],  # Only empty columns.
+    [[]],  # No columns.
+    [[], []],
+])
+@pytest.mark.parametrize('padding', [0, 1])
+@pytest.mark.parametrize('outer_border', [True, False])
+@pytest.mark.parametrize('inner_borders', [True, False])
+@pytest.mark.parametrize('title', [None, 'Title', 'Very Long Title Overlaying Columns'])
+def test_merged(table_data, padding, outer_border, inner_borders, title):
+    """Test that merging while building matches merging the whole rendered table afterwards.
+
+    :param list table_data: Table data.
+    :param int padding: Left and right padding.
+    :param bool outer_border: Table attribute.
+    :param bool inner_borders: Inner column and row borders.
+    :param str title: Table title.
+    """
+    tables = [UnixTable(table_data, title), UnmergedTable(table_data, title)]
+    for table in tables:
+        table.padding_left = table.padding_right = padding
+        table.outer_border = outer_border
+        table.inner_column_border = table.inner_row_border = table.inner_footing_row_border = inner_borders
+    expected = tables[1].table.replace('\033(B\033(0', '')
+
+    assert tables[0].table == expected
+    assert '\n'.join(tables[0].iter_lines()) == expected
+    assert '\033(B\033(0' not in tables[0].table
+
+
+def test_no_columns():
+    """Test that vertical borders of rows without columns are merged, with or without padding."""
+    table = UnixTable([[]])
+    assert table.table.split('\n')[1] == '\033(0xx\033(B'
+    table.padding_left = table.padding_right = 0
+    assert table.table.split('\n')[1] == '\033(0xx\033(B'
@@ -0,0 +1,114 @@
+"""Test CachedTerminalSize class and functions enabling it."""
+
+import os
+import signal
+import threading
+
+import pytest
+
+from terminaltables.tables import AsciiTable
+from terminaltables.terminal_io import (
+    CachedTerminalSize, disable_terminal_size_cache, enable_terminal_size_cache, terminal_size
+)
+
+from tests.test_terminal_io import MockKernel32
+
+HAS_SIGWINCH = hasattr(signal, 'SIGWINCH')
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    """Count terminal queries.
+
+    :param monkeypatch: pytest fixture.
+
+    :return: List growing by one item per query.
+    :rtype: list
+    """
+    calls = list()
+    monkeypatch.setattr('terminaltables.terminal_io.query_terminal_size', lambda *_: calls.append(1) or (100, 30))
+    yield calls
+    disable_terminal_size_cache()
+
+
+def test_fixed(queries):
+    """Test injecting a fixed size.
+
+    :param list queries: Fixture.
+    """
+    table = AsciiTable([['x' * 100]])
+    assert not table.ok
+    assert len(queries) == 1
+
+    cache = enable_terminal_size_cache((120, 40))
+    assert not cache.watching
+    assert terminal_size() == (120, 40)
+    assert table.ok
+    assert table.column_max_width(0) == 116
+    assert len(queries) == 1
+
+    disable_terminal_size_cache()
+    assert terminal_size() == (100, 30)
+
+
+def test_cached(queries):
+    """Test querying once until invalidated.
+
+    :param list queries: Fixture.
+    """
+    cache = enable_terminal_size_cache(watch=False)
+    assert [terminal_size(), terminal_size(), cache()] == [(100, 30)] * 3
+    assert len(queries) == 1
+
+    cache.invalidate()
+    assert terminal_size() == (100, 30)
+    assert len(queries) == 2
+
+    # Mock kernel32 bypasses the cache.
+    terminal_size(MockKernel32())
+    assert len(queries) == 3
+
+
+@pytest.mark.skipif(not HAS_SIGWINCH, reason='No SIGWINCH.')
+def test_sigwinch(queries):
+    """Test invalidating on SIGWINCH, chaining and restoring the previous handler.
+
+    :param list queries: Fixture.
+    """
+    received = list()
+    original = signal.signal(signal.SIGWINCH, lambda *_: received.append(1))
+    try:
+        cache = enable_terminal_size_cache()
+        assert cache.watching
+        terminal_size()
+        terminal_size()
+        assert len(queries) == 1
+
+        os.kill(os.getpid(), signal.SIGWINCH)
+        terminal_size()
+        assert len(queries) == 2
+        assert received == [1]
+
+        # Replacing the cache unwatches the old one.
+        previous = cache
+        cache = enable_terminal_size_cache()
+        assert not previous.watching
+        disable_terminal_size_cache()
+        assert not cache.watching
+        os.kill(os.getpid(), signal.SIGWINCH)
+        assert received == [1, 1]
+    finally:
+        signal.signal(signal.SIGWINCH, original)
+
+
+@pytest.mark.skipif(not HAS_SIGWINCH, reason='No SIGWINCH.')
+def test_watch_thread():
+    """Test that signal handlers can't be set outside of the main thread."""
+    cache = CachedTerminalSize()
+    results = list()
+    thread = threading.Thread(target=lambda: results.append(cache.watch()))
+    thread.start()
+    thread.join()
+    assert results == [False]
+    assert not cache.watching
+    cache.unwatch()  # No-op.
@@ -0,0 +1,82 @@
+# coding: utf-8
+"""Test function in module."""
+
+import pytest
+
+from terminaltables.width_and_alignment import fit_cell, split_at_width
+
+
+@pytest.mark.parametrize('string,width,expected', [
+    ('', 3, ('', '')),
+    ('Test', 4, ('Test', '')),
+    ('Test', 3, ('Tes', 't')),
+    ('Test', 0, ('T', 'est')),
+    (u'蓝色', 3, (u'蓝', u'色')),
+    (u'蓝色', 1, (u'蓝', u'色')),
+    ('\033[31mTest\033[39m', 2, ('\033[31mTe', 'st\033[39m')),
+])
+def test_split_at_width(string, width, expected):
+    """Test function.
+
+    :param str string: Input string to operate on.
+    :param int width: Maximum visible width of the head.
+    :param tuple expected: Expected output.
+    """
+    assert split_at_width(string, width) == expected
+
+
+def test_split_at_width_not_forced():
+    """Test that nothing is moved to the head if the first character doesn't fit and it's not forced."""
+    assert split_at_width('Test', 0, force=False) == ('', 'Test')
+    assert split_at_width(u'蓝色', 1, force=False) == ('', u'蓝色')
+    assert split_at_width('\033[31mTest\033[39m', 0, force=False) == ('\033[31m', 'Test\033[39m')
+    assert split_at_width('Test', 2, force=False) == ('Te', 'st')
+
+
+@pytest.mark.parametrize('string,width,overflow,expected', [
+    ('hi', 0, 'truncate', ''),
+    ('hi', 0, 'ellipsis', ''),
+    (u'蓝色', 1, 'truncate', ''),
+    ('\033[31mhi\033[39m', 0, 'truncate', '\033[31m\033[39m'),
+    ('hi', 0, 'wrap', 'h\ni'),
+])
+def test_fit_cell_too_narrow(string, width, overflow, expected):
+    """Test columns narrower than the first character: truncated to nothing, wrapped one character per line.
+
+    :param str string: Input string to operate on.
+    :param int width: Column width.
+    :param str overflow: Overflow policy.
+    :param str expected: Expected output.
+    """
+    assert fit_cell(string, width, overflow) == expected
+
+
+@pytest.mark.parametrize('string,overflow,expected', [
+    ('', 'truncate', ''),
+    ('', 'wrap', ''),
+    ('Test', 'truncate', 'Test'),
+    ('Testing', 'truncate', 'Testi'),
+    ('Testing', 'wrap', 'Testi\nng'),
+    ('Testi', 'ellipsis', 'Testi'),
+    ('Testing', 'ellipsis', 'Te...'),
+    ('Testing123\nTest\n', 'truncate', 'Testi\nTest\n'),
+    ('Testing123\nTest\n', 'wrap', 'Testi\nng123\nTest\n'),
+    (u'蓝色蓝色', 'truncate', u'蓝色'),
+    (u'蓝色蓝色', 'wrap', u'蓝色\n蓝色'),
+    ('\033[31mTesting\033[39m', 'truncate', '\033[31mTesti\033[39m'),
+    ('\033[31mTesting\033[39m', 'wrap', '\033[31mTesti\nng\033[39m'),
+])
+def test_fit_cell(string, overflow, expected):
+    """Test function.
+
+    :param str string: Input string to operate on.
+    :param str overflow: Overflow policy.
+    :param str expected: Expected output.
+    """
+    assert fit_cell(string, 5, overflow) == expected
+
+
+def test_invalid_overflow():
+    """Test unknown overflow policy."""
+    with pytest.raises(ValueError):
+        fit_cell('Test', 5, 'explode')
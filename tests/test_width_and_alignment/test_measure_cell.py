@@ -0,0 +1,62 @@
+# coding: utf-8
+"""Test functions in module."""
+
+import pytest
+
+from terminaltables import width_and_alignment
+from terminaltables.tables import AsciiTable
+from terminaltables.width_and_alignment import align_and_pad_cell, measure_cell, measure_table
+
+
+@pytest.mark.parametrize('string,expected', [
+    ('', ([''], [0])),
+    ('Test', (['Test'], [4])),
+    ('Test\n', (['Test', ''], [4, 0])),
+    ('Test\nMore Test', (['Test', 'More Test'], [4, 9])),
+    (u'蓝色\n\x1b[34mTest\x1b[39m', ([u'蓝色', '\x1b[34mTest\x1b[39m'], [4, 4])),
+])
+def test_measure_cell(string, expected):
+    """Test function.
+
+    :param str string: Cell contents.
+    :param tuple expected: Expected lines and widths.
+    """
+    assert measure_cell(string) == expected
+
+
+@pytest.mark.parametrize('align', ['left', 'right', 'center', 'top', 'middle', 'bottom'])
+@pytest.mark.parametrize('string', ['', 'Test\n', u'蓝色\nTest', '\x1b[34mTest\x1b[39m\n\nMore'])
+def test_align_measured(string, align):
+    """Test that align_and_pad_cell() gives the same result with a measure_cell() record.
+
+    :param str string: Cell contents.
+    :param str align: Alignment.
+    """
+    measured = measure_cell(string)
+    expected = align_and_pad_cell(string, (align,), (10, 5), (1, 2, 1, 0))
+    assert align_and_pad_cell(string, (align,), (10, 5), (1, 2, 1, 0), ' ', measured) == expected
+    assert measured == measure_cell(string)  # Not modified.
+
+
+def test_measure_table_keep_cells():
+    """Test keeping per-cell records."""
+    table_data = [[u'蓝色', ''], ['Test\nMore']]
+    widths, heights, plain, cells = measure_table(table_data, keep_cells=True)
+    assert (widths, heights, plain) == ([4, 0], [1, 2], False)
+    assert cells == [[([u'蓝色'], [4]), None], [None]]
+
+    assert measure_table([['Plain']], keep_cells=True)[2:] == (True, None)
+
+
+def test_measured_once(monkeypatch):
+    """Test that rendering a table measures each line of each cell only once.
+
+    :param monkeypatch: pytest fixture.
+    """
+    calls = list()
+    original = width_and_alignment.visible_width
+    monkeypatch.setattr('terminaltables.width_and_alignment.visible_width', lambda s: calls.append(s) or original(s))
+
+    table = AsciiTable([[u'蓝色', u'世界\n你好'], ['\x1b[34mTest\x1b[39m', '']])
+    assert table.table
+    assert sorted(calls) == sorted([u'蓝色', u'世界', u'你好', '\x1b[34mTest\x1b[39m'])
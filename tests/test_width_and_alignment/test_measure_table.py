@@ -0,0 +1,44 @@
+# coding: utf-8
+"""Test functions in module."""
+
+import pytest
+
+from terminaltables.width_and_alignment import is_ascii, measure_table, visible_width
+
+
+@pytest.mark.parametrize('string,expected', [
+    ('', True),
+    ('Test', True),
+    ('\033[31mTest\033[39m', True),
+    (u'蓝色', False),
+    (u'Caf\xe9', False),
+])
+def test_is_ascii(string, expected):
+    """Test function.
+
+    :param str string: String to check.
+    :param bool expected: Expected return value.
+    """
+    assert is_ascii(string) is expected
+
+
+@pytest.mark.parametrize('table_data,plain', [
+    ([], True),
+    ([['Name', 'Color'], ['Avocado', ''], ['Tomato', 'red']], True),
+    ([['Name', 'Color'], ['Avocado', 'gre\nen']], False),
+    ([['Name', 'Color'], ['Avocado', 'green\r']], False),
+    ([['Name', 'Color'], ['Avocado', 'gre\ten']], False),
+    ([['Name', 'Color'], ['Avocado', '\033[32mgreen\033[39m']], False),
+    ([['Name', 'Color'], ['Avocado', u'蓝色']], False),
+])
+def test_measure_table(table_data, plain):
+    """Test that the fast ASCII path measures the same dimensions and detects plain tables.
+
+    :param list table_data: Table data to measure.
+    :param bool plain: Expected plain flag.
+    """
+    widths, heights, actual, _ = measure_table(table_data)
+    assert widths == [max(visible_width(line) for row in table_data for line in row[i].splitlines() or ['']) for i in
+                      range(len(widths))]
+    assert heights == [max(c.count('\n') + 1 if c else 0 for c in row) for row in table_data]
+    assert actual is plain
@@ -1,12 +1,20 @@
 # coding: utf-8
 """Test function in module."""
 
+import sys
+import unicodedata
+
 import pytest
 from colorama import Fore
 from colorclass import Color
 from termcolor import colored
 
-from terminaltables.width_and_alignment import visible_width
+from terminaltables.width_and_alignment import disable_width_cache, enable_width_cache, visible_width
+
+try:
+    unichr
+except NameError:
+    unichr = chr  # pylint: disable=invalid-name,redefined-builtin
 
 
 @pytest.mark.parametrize('string,expected', [
@@ -57,3 +65,48 @@ def test(string, expected):
     :param int expected: Expected visible width of string (some characters are len() == 1 but take up 2 spaces).
     """
     assert visible_width(string) == expected
+
+
+@pytest.mark.parametrize('string,expected', [
+    (u'', 0),
+    (u'\U0001F600', 2),  # Emoji (plane 1, tabulated range).
+    (u'\U00020000', 2),  # CJK Extension B (plane 2).
+    (u'\U0001D400', 1),  # Mathematical bold (plane 1, narrow).
+    (u'\U000E0001', 1),  # Language tag (plane 14, not tabulated).
+    (u'a\U0001F600\u4e16', 5),
+])
+def test_astral(string, expected):
+    """Test characters outside the Basic Multilingual Plane.
+
+    :param str string: Input string to measure.
+    :param int expected: Expected visible width of string.
+    """
+    if sys.maxunicode < 0x10000:
+        return pytest.skip('Narrow Python build.')
+    assert visible_width(string) == expected
+
+
+def test_lookup_table():
+    """Test that the lookup tables agree with unicodedata on every Nth code point."""
+    for code in range(0x20, sys.maxunicode + 1, 7):
+        if 0xD800 <= code < 0xE000:
+            continue  # Surrogates.
+        char = unichr(code)
+        expected = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
+        assert visible_width(char) == expected, hex(code)
+
+
+def test_cache():
+    """Test the optional LRU cache in front of visible_width()."""
+    cache = enable_width_cache(2)
+    try:
+        assert visible_width(u'蓝色') == 4
+        assert visible_width(u'蓝色') == 4
+        assert visible_width('\x1b[34mhello\x1b[39m') == 5
+        assert visible_width('plain ascii bypasses the cache') == 30
+        assert visible_width(u'世界') == 4
+        assert cache.stats == dict(hits=1, misses=3, evictions=1, hit_rate=0.25, size=2, maxsize=2)
+    finally:
+        disable_width_cache()
+    assert visible_width(u'蓝色') == 4
+    assert cache.misses == 3